@@ -0,0 +1,55 @@
+"""
+Shared Q&A answer delivery
+
+Speaks an answer the same way for every Q&A tool: stream it while it is
+synthesized, or fall back to a cached/generated audio file and play that.
+"""
+
+from pathlib import Path
+
+
+def speak_answer(converter, audio_cache, answer, filename, stream=True):
+    """
+    Speak an answer and return the audio file path, if one was written.
+
+    Args:
+        converter: TextToAudioConverter used for synthesis and playback
+        audio_cache: AudioCache consulted before converting
+        answer: Answer text to speak
+        filename: Output filename (without extension) for the audio file
+        stream: Play sentences while later ones are still synthesizing
+
+    Returns:
+        Path to the audio file, or None if the answer was streamed or failed
+    """
+    # Speak the answer while later sentences are still synthesizing,
+    # unless it is already cached
+    if (stream and converter.playback_available
+            and not audio_cache.contains(converter, answer)):
+        print("🎧 Streaming audio answer...")
+        if converter.play_text_stream(answer):
+            print("🎵 Audio answer played successfully!")
+            return None
+        print("⚠️ Streaming failed, generating an audio file instead.")
+
+    # Convert answer to audio
+    print("🔄 Converting answer to audio...")
+    audio_path = audio_cache.convert_text(converter, answer, filename)
+
+    if not audio_path:
+        print("❌ Failed to generate audio answer.")
+        return None
+
+    audio_file = Path(audio_path)
+    file_size = audio_file.stat().st_size / 1024
+    print(f"✅ Audio answer generated: {audio_file.name} ({file_size:.1f} KB)")
+
+    # Try to play the audio
+    print("🎧 Playing audio answer...")
+    if converter.playback_available and converter.play_audio_file(audio_path):
+        print("🎵 Audio answer played successfully!")
+    else:
+        print("💾 Audio answer saved. Play it manually for audio.")
+        print(f"📁 Location: {audio_path}")
+
+    return audio_path
@@ -45,8 +45,9 @@ def demo_educational_content():
     print(f"✅ Generated {len(qa_files)} educational audio files")
     for i, file_path in enumerate(qa_files, 1):
         if file_path:
-            size = Path(file_path).stat().st_size / 1024
-            print(f"   📚 Educational Q&A {i}: {Path(file_path).name} ({size:.1f} KB)")
+            audio_file = Path(file_path)
+            size = audio_file.stat().st_size / 1024
+            print(f"   📚 Educational Q&A {i}: {audio_file.name} ({size:.1f} KB)")
     
     converter.cleanup()
     return qa_files
@@ -80,8 +81,9 @@ def demo_news_briefing():
     print(f"✅ Generated {len(news_files)} news audio segments")
     for i, file_path in enumerate(news_files, 1):
         if file_path:
-            size = Path(file_path).stat().st_size / 1024
-            print(f"   📻 News Segment {i}: {Path(file_path).name} ({size:.1f} KB)")
+            audio_file = Path(file_path)
+            size = audio_file.stat().st_size / 1024
+            print(f"   📻 News Segment {i}: {audio_file.name} ({size:.1f} KB)")
     
     converter.cleanup()
     return news_files
@@ -112,14 +114,15 @@ def demo_different_configurations():
         processing_time = time.time() - start_time
         
         if output_path:
-            size = Path(output_path).stat().st_size / 1024
+            output_file = Path(output_path)
+            size = output_file.stat().st_size / 1024
             results.append({
                 "name": config['name'],
-                "file": Path(output_path).name,
+                "file": output_file.name,
                 "size_kb": size,
                 "time_seconds": processing_time
             })
-            print(f"   ✅ {config['name']}: {Path(output_path).name} ({size:.1f} KB, {processing_time:.2f}s)")
+            print(f"   ✅ {config['name']}: {output_file.name} ({size:.1f} KB, {processing_time:.2f}s)")
         
         converter.cleanup()
     
@@ -151,7 +154,8 @@ def demo_performance_test():
         processing_time = time.time() - start_time
         
         if output_path:
-            size = Path(output_path).stat().st_size / 1024
+            output_file = Path(output_path)
+            size = output_file.stat().st_size / 1024
             words = len(test_case['text'].split())
             
             result = {
@@ -55,8 +55,9 @@ def main():
     
     for i, path in enumerate(output_paths, 1):
         if path:
-            file_size = Path(path).stat().st_size / 1024  # KB
-            print(f"  {i}. {Path(path).name} ({file_size:.1f} KB)")
+            audio_file = Path(path)
+            file_size = audio_file.stat().st_size / 1024  # KB
+            print(f"  {i}. {audio_file.name} ({file_size:.1f} KB)")
         else:
             print(f"  {i}. [FAILED]")
     
@@ -33,8 +33,9 @@ def main():
         output_path = converter.convert_text(text, f"custom_demo_{i}")
         
         if output_path:
-            file_size = Path(output_path).stat().st_size / 1024  # KB
-            print(f"✅ Success! Generated: {Path(output_path).name} ({file_size:.1f} KB)")
+            output_file = Path(output_path)
+            file_size = output_file.stat().st_size / 1024  # KB
+            print(f"✅ Success! Generated: {output_file.name} ({file_size:.1f} KB)")
         else:
             print("❌ Failed to convert")
     
@@ -45,14 +45,15 @@ def demo_user_text_to_audio():
         audio_path = converter.convert_text(text, f"demo_user_text_{i}")
         
         if audio_path:
-            file_size = Path(audio_path).stat().st_size / 1024
+            audio_file = Path(audio_path)
+            file_size = audio_file.stat().st_size / 1024
             generated_files.append(audio_path)
             
-            print(f"   ✅ Generated: {Path(audio_path).name} ({file_size:.1f} KB)")
+            print(f"   ✅ Generated: {audio_file.name} ({file_size:.1f} KB)")
             
             # Try to play audio
             print(f"   🎧 Playing audio...")
-            play_success = converter.play_audio_file(audio_path)
+            play_success = converter.playback_available and converter.play_audio_file(audio_path)
             
             if play_success:
                 print(f"   ✅ Audio played successfully!")
@@ -65,8 +66,9 @@ def demo_user_text_to_audio():
     
     print(f"🎉 Demo completed! Generated {len(generated_files)} audio files:")
     for i, file_path in enumerate(generated_files, 1):
-        size = Path(file_path).stat().st_size / 1024
-        print(f"   {i}. {Path(file_path).name} ({size:.1f} KB)")
+        audio_file = Path(file_path)
+        size = audio_file.stat().st_size / 1024
+        print(f"   {i}. {audio_file.name} ({size:.1f} KB)")
     
     converter.cleanup()
     return generated_files
@@ -97,7 +97,7 @@ class SimpleAudioGenerator:
                 inputs = self.processor(text=chunk, return_tensors="pt")
                 
                 # Generate speech
-                with torch.no_grad():
+                with torch.inference_mode():
                     speech = self.model.generate_speech(
                         inputs["input_ids"], 
                         self.speaker_embeddings, 
@@ -219,11 +219,12 @@ def answer_question(question):
         audio_path = audio_gen.generate_audio(answer, filename)
         
         if audio_path:
-            file_size = Path(audio_path).stat().st_size / 1024
+            audio_file = Path(audio_path)
+            file_size = audio_file.stat().st_size / 1024
             estimated_duration = len(answer.split()) * 0.6  # words per minute estimate
             
             print(f"✅ Audio generated successfully!")
-            print(f"🎵 File: {Path(audio_path).name} ({file_size:.1f} KB)")
+            print(f"🎵 File: {audio_file.name} ({file_size:.1f} KB)")
             print(f"⏱️ Estimated duration: {estimated_duration:.1f} seconds")
             
             # Try to play
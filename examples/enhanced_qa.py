@@ -212,19 +212,20 @@ def answer_question(question):
             audio_path = converter.convert_text(answer, filename)
             generation_time = time.time() - start_time
             
-            if audio_path and Path(audio_path).exists():
-                file_size = Path(audio_path).stat().st_size / 1024
+            audio_file = Path(audio_path) if audio_path else None
+            if audio_file and audio_file.exists():
+                file_size = audio_file.stat().st_size / 1024
                 duration_estimate = len(answer.split()) * 0.5  # Rough estimate
                 
                 print(f"✅ Audio generated successfully!")
                 print(f"📄 Full answer length: {len(answer)} characters")
-                print(f"🎵 Audio file: {Path(audio_path).name} ({file_size:.1f} KB)")
+                print(f"🎵 Audio file: {audio_file.name} ({file_size:.1f} KB)")
                 print(f"⏱️ Generation time: {generation_time:.1f} seconds")
                 print(f"🕐 Estimated duration: {duration_estimate:.1f} seconds")
                 
                 # Try to play audio
                 print("🎧 Playing detailed audio answer...")
-                play_success = converter.play_audio_file(audio_path)
+                play_success = converter.playback_available and converter.play_audio_file(audio_path)
                 
                 if play_success:
                     print("🎵 Audio playback started successfully!")
@@ -88,12 +88,13 @@ def test_audio_generation():
     test_text = "This is a test to verify that audio generation is working correctly."
     audio_path = converter.convert_text(test_text, "audio_test")
     
-    if audio_path and Path(audio_path).exists():
-        file_size = Path(audio_path).stat().st_size / 1024
-        print(f"✅ Audio test successful: {Path(audio_path).name} ({file_size:.1f} KB)")
+    audio_file = Path(audio_path) if audio_path else None
+    if audio_file and audio_file.exists():
+        file_size = audio_file.stat().st_size / 1024
+        print(f"✅ Audio test successful: {audio_file.name} ({file_size:.1f} KB)")
         
         # Try to play the test audio
-        play_success = converter.play_audio_file(audio_path)
+        play_success = converter.playback_available and converter.play_audio_file(audio_path)
         if play_success:
             print("🎧 Audio playback test successful!")
         else:
@@ -123,13 +124,14 @@ def answer_question(question):
         try:
             audio_path = converter.convert_text(answer, "qa_answer")
             
-            if audio_path and Path(audio_path).exists():
-                file_size = Path(audio_path).stat().st_size / 1024
-                print(f"✅ Audio answer generated: {Path(audio_path).name} ({file_size:.1f} KB)")
+            audio_file = Path(audio_path) if audio_path else None
+            if audio_file and audio_file.exists():
+                file_size = audio_file.stat().st_size / 1024
+                print(f"✅ Audio answer generated: {audio_file.name} ({file_size:.1f} KB)")
                 
                 # Try to play audio
                 print("🎧 Playing audio answer...")
-                play_success = converter.play_audio_file(audio_path)
+                play_success = converter.playback_available and converter.play_audio_file(audio_path)
                 
                 if play_success:
                     print("🎵 Audio played successfully!")
@@ -138,7 +140,7 @@ def answer_question(question):
                     print(f"📁 Location: {audio_path}")
                 
                 print(f"📊 Audio file size: {file_size:.1f} KB")
-                print(f"📂 Saved in: {Path(audio_path).parent}")
+                print(f"📂 Saved in: {audio_file.parent}")
             else:
                 print("❌ Failed to generate audio file.")
         
@@ -12,12 +12,37 @@ import sys
 import os
 from pathlib import Path
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from typing import Union, get_args, get_origin, get_type_hints
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from main import TextToAudioConverter
 from dataset_manager import DatasetManager
+from audio_cache import AudioCache
+
+# Parsers for user-entered setting values, keyed by the setting's type
+SETTING_COERCIONS = {
+    bool: lambda value: value.lower() == 'true',
+    int: int,
+    float: float,
+    str: str,
+}
+
+def _coerce_setting(declared_type, value):
+    """Parse a user-entered value for a config field of the declared type."""
+    args = get_args(declared_type)
+    if get_origin(declared_type) is Union and type(None) in args:
+        # Optional field: blank or 'none' clears it
+        if value == '' or value.lower() == 'none':
+            return None
+        declared_type = next(arg for arg in args if arg is not type(None))
+    return SETTING_COERCIONS[declared_type](value)
+
+# Canonical form used to recognise texts that only differ in spacing or case
+_canon = lambda text: " ".join(text.split()).casefold()
 
 class InteractiveTextToAudio:
     """Interactive interface for text-to-audio conversion."""
@@ -29,6 +54,9 @@ class InteractiveTextToAudio:
         self.dataset_manager = DatasetManager()
         self.session_files = []
         
+        # Audio generated this session, keyed by canonical text
+        self._run_cache = {}
+        
         print("✅ System ready!")
         print(f"📂 Audio files will be saved in: {self.converter.output_dir}")
         print()
@@ -64,27 +92,35 @@ class InteractiveTextToAudio:
             
             print(f"🔄 Converting: '{text[:50]}{'...' if len(text) > 50 else ''}'")
             
-            # Generate filename with timestamp
-            timestamp = int(time.time())
-            filename = f"interactive_{timestamp}"
+            # Name the file after its content so repeated texts reuse it
+            key = _canon(text)
+            filename = self._content_filename("interactive", key)
+            target = Path(self.converter.output_dir) / f"{filename}.{self.converter.config.audio_format}"
             
             # Convert text to audio
             start_time = time.time()
-            audio_path = self.converter.convert_text(text, filename)
+            if key in self._run_cache:
+                audio_path = self._run_cache[key]
+            elif target.exists():
+                audio_path = str(target)
+            else:
+                audio_path = self.converter.convert_text(text, filename)
             conversion_time = time.time() - start_time
             
             if audio_path:
+                self._run_cache[key] = audio_path
                 self.session_files.append(audio_path)
-                file_size = Path(audio_path).stat().st_size / 1024
+                audio_file = Path(audio_path)
+                file_size = audio_file.stat().st_size / 1024
                 
                 print(f"✅ Conversion successful!")
-                print(f"   📄 File: {Path(audio_path).name}")
+                print(f"   📄 File: {audio_file.name}")
                 print(f"   📊 Size: {file_size:.1f} KB")
                 print(f"   ⏱️ Time: {conversion_time:.2f} seconds")
                 
                 # Attempt to play audio
                 print("🎧 Playing audio...")
-                play_success = self.converter.play_audio_file(audio_path)
+                play_success = self.converter.playback_available and self.converter.play_audio_file(audio_path)
                 
                 if not play_success:
                     print("ℹ️ Audio file saved successfully but playback not available.")
@@ -128,10 +164,19 @@ class InteractiveTextToAudio:
             print("ℹ️ No Q&A pairs to process.")
             return
         
+        # Offer to play each pair while the next one is being synthesized
+        play_choice = input(f"\n🎧 Play the Q&A audio files as they are generated? (y/n): ").strip().lower()
+        
         print(f"\n🔄 Converting {len(qa_pairs)} Q&A pairs...")
         
+        if play_choice == 'y':
+            successful = self._convert_and_play_qa_pairs(qa_pairs)
+            self.session_files.extend(successful)
+            print(f"\n✅ Generated {len(successful)} Q&A audio files")
+            return
+        
         # Convert Q&A pairs
-        audio_files = self.converter.convert_questions_and_answers(qa_pairs, include_questions=True)
+        audio_files = [self._convert_qa_pair(qa_pair) for qa_pair in qa_pairs]
         
         successful = [f for f in audio_files if f]
         self.session_files.extend(successful)
@@ -139,18 +184,68 @@ class InteractiveTextToAudio:
         print(f"✅ Generated {len(successful)} Q&A audio files:")
         for i, file_path in enumerate(successful, 1):
             if file_path:
-                size = Path(file_path).stat().st_size / 1024
-                print(f"   {i}. {Path(file_path).name} ({size:.1f} KB)")
-        
-        # Offer to play the files
-        if successful:
-            play_choice = input(f"\n🎧 Play the Q&A audio files? (y/n): ").strip().lower()
-            if play_choice == 'y':
-                for i, file_path in enumerate(successful, 1):
-                    print(f"\n🎵 Playing Q&A {i}/{len(successful)}: {Path(file_path).name}")
-                    self.converter.play_audio_file(file_path)
-                    if i < len(successful):
-                        input("   Press Enter for next audio...")
+                audio_file = Path(file_path)
+                size = audio_file.stat().st_size / 1024
+                print(f"   {i}. {audio_file.name} ({size:.1f} KB)")
+    
+    def _content_filename(self, prefix, key):
+        """Name an output file after its canonical text and the audio settings.
+        
+        Uses the same key as AudioCache, so files made with another model,
+        precision or output setting are never reused.
+        """
+        return f"{prefix}_{AudioCache.make_key(key, self.converter)[:16]}"
+    
+    def _convert_cached(self, text, prefix, **kwargs):
+        """Convert text to audio, reusing this session's output for equivalent text.
+        
+        Files are named after their content, so a later run never overwrites
+        a file another cache entry points to.
+        """
+        key = _canon(text)
+        
+        if key not in self._run_cache:
+            filename = self._content_filename(prefix, key)
+            audio_path = self.converter.convert_text(text, filename, **kwargs)
+            if not audio_path:
+                return None
+            self._run_cache[key] = audio_path
+        
+        return self._run_cache[key]
+    
+    def _convert_qa_pair(self, qa_pair):
+        """Convert a single Q&A pair to audio."""
+        text = f"Question: {qa_pair['question']}. Answer: {qa_pair['answer']}"
+        return self._convert_cached(text, "qa")
+    
+    def _convert_and_play_qa_pairs(self, qa_pairs):
+        """Play each Q&A pair while the next one is synthesized in the background."""
+        successful = []
+        
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(self._convert_qa_pair, qa_pairs[0])
+            
+            for i in range(len(qa_pairs)):
+                file_path = future.result()
+                
+                # Start on the next pair before playing this one
+                if i + 1 < len(qa_pairs):
+                    future = pool.submit(self._convert_qa_pair, qa_pairs[i + 1])
+                
+                if not file_path:
+                    print(f"❌ Q&A {i + 1}/{len(qa_pairs)} failed to convert")
+                    continue
+                
+                successful.append(file_path)
+                audio_file = Path(file_path)
+                size = audio_file.stat().st_size / 1024
+                print(f"\n🎵 Playing Q&A {i + 1}/{len(qa_pairs)}: {audio_file.name} ({size:.1f} KB)")
+                self.converter.play_audio_file(file_path)
+                
+                if i + 1 < len(qa_pairs):
+                    input("   Press Enter for next audio...")
+        
+        return successful
     
     def batch_process_mode(self):
         """Interactive batch processing."""
@@ -179,7 +274,10 @@ class InteractiveTextToAudio:
         print(f"\n🔄 Processing {len(texts)} texts...")
         
         # Process batch
-        batch_files = self.converter.convert_batch(texts, "batch_interactive")
+        batch_files = [
+            self._convert_cached(text, "batch_interactive", reuse_buffer=True)
+            for text in texts
+        ]
         
         successful = [f for f in batch_files if f]
         self.session_files.extend(successful)
@@ -187,8 +285,9 @@ class InteractiveTextToAudio:
         print(f"✅ Generated {len(successful)} audio files:")
         for i, file_path in enumerate(successful, 1):
             if file_path:
-                size = Path(file_path).stat().st_size / 1024
-                print(f"   {i}. {Path(file_path).name} ({size:.1f} KB)")
+                audio_file = Path(file_path)
+                size = audio_file.stat().st_size / 1024
+                print(f"   {i}. {audio_file.name} ({size:.1f} KB)")
     
     def dataset_operations(self):
         """Dataset management operations."""
@@ -287,8 +386,8 @@ class InteractiveTextToAudio:
         current_config = self.converter.config
         
         print("Current Configuration:")
-        for key, value in current_config.items():
-            print(f"   {key}: {value}")
+        for field in fields(current_config):
+            print(f"   {field.name}: {getattr(current_config, field.name)}")
         
         print("\nAvailable settings to modify:")
         print("1. audio_format (wav, mp3, flac, ogg)")
@@ -302,20 +401,22 @@ class InteractiveTextToAudio:
         if setting.lower() == 'back':
             return
         
-        if setting in current_config:
-            new_value = input(f"New value for {setting} (current: {current_config[setting]}): ").strip()
+        if setting in {field.name for field in fields(current_config)}:
+            current_value = getattr(current_config, setting)
+            new_value = input(f"New value for {setting} (current: {current_value}): ").strip()
             
-            # Convert to appropriate type
-            if setting in ['normalize_audio', 'apply_fade', 'noise_reduction']:
-                new_value = new_value.lower() == 'true'
-            elif setting == 'segment_gap_ms':
-                try:
-                    new_value = int(new_value)
-                except ValueError:
-                    print("❌ Invalid number")
-                    return
+            # Convert to the field's declared type
+            try:
+                declared_type = get_type_hints(type(current_config))[setting]
+                new_value = _coerce_setting(declared_type, new_value)
+            except (KeyError, TypeError, ValueError):
+                print("❌ Invalid value")
+                return
             
             self.converter.update_config(**{setting: new_value})
+            
+            # Audio from earlier settings no longer matches
+            self._run_cache.clear()
             print(f"✅ Updated {setting} to {new_value}")
         else:
             print("❌ Invalid setting name")
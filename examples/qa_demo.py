@@ -66,7 +66,7 @@ def demo_qa_system():
             
             # Try to play audio
             print("🎧 Playing audio...")
-            play_success = converter.play_audio_file(audio_path)
+            play_success = converter.playback_available and converter.play_audio_file(audio_path)
             
             if play_success:
                 print("🎵 Audio played successfully!")
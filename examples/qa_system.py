@@ -8,24 +8,58 @@ This system allows users to:
 4. Play audio answers immediately
 """
 
+import os
 import sys
 from pathlib import Path
 import json
+import mmap
+import re
 import time
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from main import TextToAudioConverter
+from audio_cache import AudioCache, AudioPrefetcher
+from _qa_core import speak_answer
+
+try:
+    # Faster JSON parsing/serialization when available
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    # Progress bars for batch conversion when available
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    TQDM_AVAILABLE = False
 
 class QATextToAudio:
     """Interactive Q&A system with text-to-audio conversion."""
     
-    def __init__(self):
-        """Initialize the Q&A system."""
+    def __init__(self, stream=True):
+        """
+        Initialize the Q&A system.
+        
+        Args:
+            stream: Play answers while they are synthesized instead of
+                writing an audio file first
+        """
         print("🎓 Initializing Q&A Text-to-Audio System...")
+        self.stream = stream
         self.converter = TextToAudioConverter()
+        self.audio_cache = AudioCache()
+        self.prefetcher = AudioPrefetcher(self.audio_cache, self.converter)
         self.qa_database = self.load_qa_database()
+        self.question_counts = self.load_question_counts()
+        self._build_word_index()
+        self._compile_partial_re()
         print("✅ System ready!\n")
     
     def load_qa_database(self):
@@ -34,6 +68,11 @@ class QATextToAudio:
         
         if db_file.exists():
             try:
+                if ORJSON_AVAILABLE:
+                    # Parse straight from the mapped file without an extra copy
+                    with open(db_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        with memoryview(mm) as view:
+                            return orjson.loads(view)
                 with open(db_file, 'r', encoding='utf-8') as f:
                     return json.load(f)
             except:
@@ -61,28 +100,104 @@ class QATextToAudio:
     def save_qa_database(self):
         """Save Q&A database to file."""
         try:
-            with open("qa_database.json", 'w', encoding='utf-8') as f:
-                json.dump(self.qa_database, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open("qa_database.json", 'wb') as f:
+                    f.write(orjson.dumps(self.qa_database, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open("qa_database.json", 'w', encoding='utf-8') as f:
+                    json.dump(self.qa_database, f, indent=2, ensure_ascii=False)
             print("💾 Q&A database saved successfully!")
         except Exception as e:
             print(f"⚠️ Failed to save database: {e}")
     
-    def normalize_question(self, question):
+    def load_question_counts(self):
+        """Load how often each database question has been asked."""
+        counts_file = Path("qa_question_counts.json")
+        
+        if counts_file.exists():
+            try:
+                with open(counts_file, 'r', encoding='utf-8') as f:
+                    return Counter(json.load(f))
+            except:
+                pass
+        
+        return Counter()
+    
+    def save_question_counts(self):
+        """Save question counts to file."""
+        try:
+            with open("qa_question_counts.json", 'w', encoding='utf-8') as f:
+                json.dump(self.question_counts, f, indent=2, ensure_ascii=False)
+        except Exception as e:
+            print(f"⚠️ Failed to save question counts: {e}")
+    
+    def prefetch_popular_answers(self, top_k=5):
+        """Synthesize the most frequently asked answers in the background."""
+        popular = sorted(self.qa_database, key=lambda q: -self.question_counts[q])[:top_k]
+        self.prefetcher.prefetch(self.qa_database[q] for q in popular)
+    
+    def _build_word_index(self):
+        """Index database questions by their content words."""
+        self._word_index = defaultdict(list)
+        for db_question in self.qa_database:
+            self._index_question(db_question)
+    
+    def _index_question(self, db_question):
+        """Add a database question to the word index."""
+        for word in dict.fromkeys(db_question.split()):
+            if len(word) > 3:
+                self._word_index[word].append(db_question)
+    
+    def _compile_partial_re(self):
+        """Compile a regex matching any database question, longest first."""
+        db_questions = sorted(self.qa_database, key=len, reverse=True)
+        self._partial_re = re.compile("|".join(map(re.escape, db_questions))) if db_questions else None
+        # All database questions in one string, for a single-scan substring check
+        self._key_text = "\0".join(db_questions)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def normalize_question(question):
         """Normalize question for matching."""
-        return question.lower().strip().rstrip('?')
+        return question.lower().strip().rstrip('?.!')
     
     def find_answer(self, question):
         """Find answer for a question."""
-        normalized_q = self.normalize_question(question)
+        db_question = self._match_question(self.normalize_question(question))
+        
+        if db_question is None:
+            return None
+        
+        self.question_counts[db_question] += 1
+        return self.qa_database[db_question]
+    
+    def _match_question(self, normalized_q):
+        """Find the database question matching a normalized question."""
+        if not normalized_q:
+            return None
         
         # Exact match
         if normalized_q in self.qa_database:
-            return self.qa_database[normalized_q]
+            return normalized_q
         
-        # Partial match
-        for db_question, answer in self.qa_database.items():
-            if normalized_q in db_question or db_question in normalized_q:
-                return answer
+        # Database question contained in the query
+        match = self._partial_re.search(normalized_q) if self._partial_re else None
+        if match:
+            return match.group(0)
+        
+        # Skip the scan when no database question contains the query
+        if normalized_q not in self._key_text:
+            return None
+        
+        # Query contained in a database question, trying those that share
+        # a content word first
+        words = [word for word in normalized_q.split() if len(word) > 3]
+        candidates = dict.fromkeys(
+            db_question for word in words for db_question in self._word_index.get(word, ())
+        )
+        for db_question in chain(candidates, self.qa_database):
+            if normalized_q in db_question:
+                return db_question
         
         # No match found
         return None
@@ -90,7 +205,11 @@ class QATextToAudio:
     def add_qa_pair(self, question, answer):
         """Add new Q&A pair to database."""
         normalized_q = self.normalize_question(question)
+        is_new = normalized_q not in self.qa_database
         self.qa_database[normalized_q] = answer
+        if is_new:
+            self._index_question(normalized_q)
+            self._compile_partial_re()
         self.save_qa_database()
         print(f"✅ Added new Q&A pair to database!")
     
@@ -103,30 +222,11 @@ class QATextToAudio:
         if answer:
             print(f"💬 Answer found: {answer[:100]}{'...' if len(answer) > 100 else ''}")
             
-            # Convert answer to audio
-            timestamp = int(time.time())
-            filename = f"qa_answer_{timestamp}"
-            
-            print("🔄 Converting answer to audio...")
-            audio_path = self.converter.convert_text(answer, filename)
+            # Pause background prefetching while this answer is produced
+            with self.prefetcher.busy():
+                audio_path = self._deliver_answer(answer)
             
-            if audio_path:
-                file_size = Path(audio_path).stat().st_size / 1024
-                print(f"✅ Audio answer generated: {Path(audio_path).name} ({file_size:.1f} KB)")
-                
-                # Try to play the audio
-                print("🎧 Playing audio answer...")
-                play_success = self.converter.play_audio_file(audio_path)
-                
-                if play_success:
-                    print("🎵 Audio answer played successfully!")
-                else:
-                    print("💾 Audio answer saved. Play it manually for audio.")
-                
-                return audio_path, answer
-            else:
-                print("❌ Failed to generate audio answer.")
-                return None, answer
+            return audio_path, answer
         else:
             print("❌ Sorry, I don't have an answer for that question.")
             
@@ -140,6 +240,11 @@ class QATextToAudio:
             
             return None, None
     
+    def _deliver_answer(self, answer):
+        """Speak an answer and return the audio file path, if one was written."""
+        filename = f"qa_answer_{int(time.time())}"
+        return speak_answer(self.converter, self.audio_cache, answer, filename, self.stream)
+    
     def show_available_questions(self):
         """Show available questions in the database."""
         print("\n📋 Available Questions in Database:")
@@ -159,6 +264,9 @@ class QATextToAudio:
         print("Type 'add' to add a new Q&A pair")
         print("Type 'quit' to exit\n")
         
+        # Cache popular answers while the user types
+        self.prefetch_popular_answers()
+        
         while True:
             try:
                 question = input("❓ Your question: ").strip()
@@ -190,6 +298,8 @@ class QATextToAudio:
                 audio_path, answer = self.ask_question(question)
                 print("─" * 50 + "\n")
                 
+                self.prefetch_popular_answers()
+                
                 if answer:
                     # Ask if they want another question
                     continue_choice = input("Ask another question? (y/n): ").strip().lower()
@@ -200,44 +310,69 @@ class QATextToAudio:
                 print("\n👋 Goodbye!")
                 break
     
-    def batch_qa_conversion(self):
+    def batch_qa_conversion(self, batch_size=8):
         """Convert multiple Q&A pairs to audio files."""
         print("\n📦 Batch Q&A Audio Conversion")
         print("=" * 35)
         
-        questions = list(self.qa_database.keys())
-        print(f"Converting {len(questions)} Q&A pairs to audio...\n")
+        db = self.qa_database
+        questions = list(db)
+        total = len(questions)
+        print(f"Converting {total} Q&A pairs to audio...\n")
         
-        generated_files = []
+        # Synthesize all pairs together, batch_size text chunks per forward pass
+        items = [
+            (f"Question: {question.title()}? Answer: {db[question]}", f"qa_batch_{i:03d}")
+            for i, question in enumerate(questions, 1)
+        ]
         
-        for i, question in enumerate(questions, 1):
-            answer = self.qa_database[question]
-            
-            print(f"🔄 {i}/{len(questions)}: {question.title()}?")
-            
-            # Create Q&A audio
-            qa_text = f"Question: {question.title()}? Answer: {answer}"
-            filename = f"qa_batch_{i:03d}"
+        # Report progress as chunks are synthesized, the slow part of the batch
+        if TQDM_AVAILABLE:
+            progress = tqdm(total=0, unit="chunk", mininterval=0.5)
             
-            audio_path = self.converter.convert_text(qa_text, filename)
+            def report(done, chunks):
+                progress.total = chunks
+                progress.update(done - progress.n)
+        else:
+            progress = None
             
-            if audio_path:
-                size = Path(audio_path).stat().st_size / 1024
-                generated_files.append(audio_path)
-                print(f"   ✅ Generated: {Path(audio_path).name} ({size:.1f} KB)")
-            else:
-                print(f"   ❌ Failed to generate audio")
+            def report(done, chunks):
+                print(f"\r   Synthesized {done}/{chunks} chunks", end="" if done < chunks else "\n", flush=True)
+        
+        try:
+            audio_paths = self.audio_cache.convert_batch(
+                self.converter, items, batch_size=batch_size, progress_callback=report
+            )
+        finally:
+            if progress is not None:
+                progress.close()
+        
+        generated_files = [audio_path for audio_path in audio_paths if audio_path]
+        failed_questions = [
+            question for question, audio_path in zip(questions, audio_paths) if not audio_path
+        ]
+        
+        for question in failed_questions:
+            print(f"   ❌ Failed to generate audio: {question.title()}?")
         
         print(f"\n🎉 Batch conversion completed!")
         print(f"Generated {len(generated_files)} audio files:")
         
-        for file_path in generated_files:
-            print(f"   🎵 {Path(file_path).name}")
+        # List the files confirmed on disk with a single directory scan
+        names = [os.path.basename(file_path) for file_path in generated_files]
+        with os.scandir(self.converter.output_dir) as entries:
+            on_disk = {entry.name for entry in entries}
+        
+        for name in names:
+            if name in on_disk:
+                print(f"   🎵 {name}")
         
         return generated_files
     
     def cleanup(self):
         """Cleanup system resources."""
+        self.save_question_counts()
+        self.audio_cache.close()
         self.converter.cleanup()
 
 def main():
@@ -245,7 +380,7 @@ def main():
     print("🎓 Q&A Text-to-Audio System")
     print("=" * 35)
     
-    qa_system = QATextToAudio()
+    qa_system = QATextToAudio(stream="--no-stream" not in sys.argv[1:])
     
     try:
         while True:
@@ -3,6 +3,9 @@ Quick Text-to-Audio Converter
 
 Usage: python quick_convert.py "Your text here"
 Or run without arguments for interactive mode
+Add --no-cache to always synthesize instead of reusing cached audio
+Add --precision float32|float16|bfloat16 to override the model precision
+Add --int8 to quantize the model's linear layers to int8 (CPU only)
 """
 
 import sys
@@ -12,19 +15,21 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
 from main import TextToAudioConverter
+from audio_cache import AudioCache
 
-def convert_text(text, filename=None):
+def convert_text(text, filename=None, use_cache=True, precision=None, quantization=None):
     """Convert text to audio and return the file path."""
     print(f"🔄 Converting: '{text[:50]}{'...' if len(text) > 50 else ''}'")
     
     # Initialize converter
-    converter = TextToAudioConverter()
+    converter = TextToAudioConverter(dtype=precision, quantization=quantization)
+    audio_cache = AudioCache(enabled=use_cache)
     
     # Convert text
     if not filename:
         filename = "quick_convert"
     
-    audio_path = converter.convert_text(text, filename)
+    audio_path = audio_cache.convert_text(converter, text, filename)
     
     if audio_path:
         file_size = Path(audio_path).stat().st_size / 1024
@@ -33,7 +38,7 @@ def convert_text(text, filename=None):
         
         # Try to play the audio
         print("🎧 Attempting to play audio...")
-        play_success = converter.play_audio_file(audio_path)
+        play_success = converter.playback_available and converter.play_audio_file(audio_path)
         
         if play_success:
             print("🎵 Audio played successfully!")
@@ -43,10 +48,11 @@ def convert_text(text, filename=None):
         print("❌ Conversion failed.")
         audio_path = None
     
+    audio_cache.close()
     converter.cleanup()
     return audio_path
 
-def interactive_mode():
+def interactive_mode(use_cache=True, precision=None, quantization=None):
     """Run in interactive mode."""
     print("🎵 Interactive Text-to-Audio Converter")
     print("=" * 40)
@@ -68,7 +74,10 @@ def interactive_mode():
                 continue
             
             # Convert the text
-            audio_path = convert_text(text, f"interactive_{count}")
+            audio_path = convert_text(
+                text, f"interactive_{count}", use_cache=use_cache,
+                precision=precision, quantization=quantization
+            )
             
             if audio_path:
                 print(f"🎉 Conversion #{count} completed!\n")
@@ -82,17 +91,35 @@ def interactive_mode():
         except Exception as e:
             print(f"❌ Error: {e}")
 
+# Values accepted by --precision
+PRECISIONS = ("float32", "float16", "bfloat16")
+
 def main():
     """Main function."""
-    if len(sys.argv) > 1:
+    args = sys.argv[1:]
+    use_cache = "--no-cache" not in args
+    quantization = "int8" if "--int8" in args else None
+    args = [arg for arg in args if arg not in ("--no-cache", "--int8")]
+    
+    precision = None
+    if "--precision" in args:
+        index = args.index("--precision")
+        precision = args[index + 1] if index + 1 < len(args) else None
+        if precision not in PRECISIONS:
+            print(f"❌ --precision must be one of: {', '.join(PRECISIONS)}")
+            print(__doc__)
+            sys.exit(2)
+        del args[index:index + 2]
+    
+    if args:
         # Command line mode
-        text = " ".join(sys.argv[1:])
+        text = " ".join(args)
         print("🎵 Quick Text-to-Audio Converter")
         print("=" * 35)
-        convert_text(text)
+        convert_text(text, use_cache=use_cache, precision=precision, quantization=quantization)
     else:
         # Interactive mode
-        interactive_mode()
+        interactive_mode(use_cache=use_cache, precision=precision, quantization=quantization)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
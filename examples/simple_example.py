@@ -36,7 +36,7 @@ def main():
         
         # Try to play the audio
         print("\n🔊 Attempting to play audio...")
-        played = converter.play_audio_file(output_path)
+        played = converter.playback_available and converter.play_audio_file(output_path)
         
         if played:
             print("🎵 Audio playback started!")
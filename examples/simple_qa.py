@@ -4,17 +4,24 @@ Simple Q&A Command Line Tool
 Usage: 
 - python simple_qa.py "your question here"
 - python simple_qa.py (for interactive mode)
+- add --no-stream to write the answer to a file before playing it
+- add --precision float32|float16|bfloat16 to override the model precision
 
 This tool answers questions and converts the answers to audio.
 """
 
 import sys
+import re
+import atexit
+from collections import Counter, defaultdict
+from functools import lru_cache
 from pathlib import Path
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent.parent / "src"))
 
-from main import TextToAudioConverter
+from audio_cache import AudioCache, AudioPrefetcher
+from _qa_core import speak_answer
 
 # Built-in Q&A knowledge base
 QA_DATABASE = {
@@ -43,27 +50,114 @@ QA_DATABASE = {
     "what can you do": "I can answer questions about artificial intelligence, machine learning, programming, and technology topics. I convert my answers into high-quality audio files that you can listen to immediately.",
 }
 
+# Converter shared by every question; the TTS model is loaded on first use
+_CONVERTER = None
+
+# Model precision for the shared converter (None picks one for the device)
+_PRECISION = None
+
+# Generated answers persist across runs
+_AUDIO_CACHE = AudioCache()
+
+# Caches popular answers in the background while the user types
+_PREFETCHER = None
+
+# How often each database question has been asked this session
+_QUESTION_COUNTS = Counter()
+
+def _get_converter():
+    """Return the shared converter, creating it on first use."""
+    global _CONVERTER
+    if _CONVERTER is None:
+        # Imported here so lookups that need no audio skip loading torch
+        from main import TextToAudioConverter
+        _CONVERTER = TextToAudioConverter(dtype=_PRECISION)
+    return _CONVERTER
+
+def _get_prefetcher():
+    """Return the shared prefetcher, creating it on first use."""
+    global _PREFETCHER
+    if _PREFETCHER is None:
+        _PREFETCHER = AudioPrefetcher(_AUDIO_CACHE, _get_converter())
+    return _PREFETCHER
+
+def _prefetch_popular_answers(top_k=5):
+    """Synthesize the most frequently asked answers in the background."""
+    popular = sorted(_NORM_DB, key=lambda q: -_QUESTION_COUNTS[q])[:top_k]
+    _get_prefetcher().prefetch(_NORM_DB[q] for q in popular)
+
+def _cleanup_converter():
+    """Release the shared converter at interpreter exit."""
+    _AUDIO_CACHE.close()
+    if _CONVERTER is not None:
+        _CONVERTER.cleanup()
+
+atexit.register(_cleanup_converter)
+
+@lru_cache(maxsize=4096)
 def normalize_question(question):
     """Normalize question for matching."""
-    return question.lower().strip().rstrip('?').rstrip('.')
+    return question.lower().strip().rstrip('?.!')
+
+# Lookup tables built once from the knowledge base
+_NORM_DB = {normalize_question(q): a for q, a in QA_DATABASE.items()}
+_WORD_INDEX = defaultdict(list)
+for _db_question in _NORM_DB:
+    for _word in dict.fromkeys(_db_question.split()):
+        if len(_word) > 3:
+            _WORD_INDEX[_word].append(_db_question)
+
+# Matches any database question contained in a query, longest first
+_PARTIAL_RE = re.compile("|".join(re.escape(q) for q in sorted(_NORM_DB, key=len, reverse=True)))
+
+# All database questions in one string, for a single-scan substring check
+_KEY_TEXT = "\0".join(_NORM_DB)
 
 def find_answer(question):
     """Find answer for a question."""
-    normalized_q = normalize_question(question)
+    db_question = _match_question(normalize_question(question))
+    
+    if db_question is None:
+        return None
+    
+    _QUESTION_COUNTS[db_question] += 1
+    return _NORM_DB[db_question]
+
+def _match_question(normalized_q):
+    """Find the database question matching a normalized question."""
+    if not normalized_q:
+        return None
     
     # Direct match
-    if normalized_q in QA_DATABASE:
-        return QA_DATABASE[normalized_q]
+    if normalized_q in _NORM_DB:
+        return normalized_q
+    
+    # Database question contained in the query
+    match = _PARTIAL_RE.search(normalized_q)
+    if match:
+        return match.group(0)
+    
+    # Questions sharing a content word
+    words = [word for word in normalized_q.split() if len(word) > 3]
+    for word in words:
+        candidates = _WORD_INDEX.get(word)
+        if candidates:
+            return candidates[0]
+    
+    # Nothing below can match unless the query or one of its words
+    # appears somewhere in the database questions
+    if normalized_q not in _KEY_TEXT and not any(word in _KEY_TEXT for word in words):
+        return None
     
     # Partial matching
-    for db_question, answer in QA_DATABASE.items():
-        if normalized_q in db_question or any(word in db_question for word in normalized_q.split() if len(word) > 3):
-            return answer
+    for db_question in _NORM_DB:
+        if normalized_q in db_question or any(word in db_question for word in words):
+            return db_question
     
     # No match found
     return None
 
-def answer_question(question):
+def answer_question(question, stream=True):
     """Answer a question and convert to audio."""
     print(f"❓ Question: {question}")
     
@@ -73,29 +167,12 @@ def answer_question(question):
         print(f"💬 Answer: {answer}")
         print()
         
-        # Convert to audio
-        print("🔄 Converting answer to audio...")
-        converter = TextToAudioConverter()
-        
-        audio_path = converter.convert_text(answer, "qa_answer")
+        converter = _get_converter()
         
-        if audio_path:
-            file_size = Path(audio_path).stat().st_size / 1024
-            print(f"✅ Audio answer generated: {Path(audio_path).name} ({file_size:.1f} KB)")
-            
-            # Try to play audio
-            print("🎧 Playing audio answer...")
-            play_success = converter.play_audio_file(audio_path)
-            
-            if play_success:
-                print("🎵 Audio played successfully!")
-            else:
-                print("💾 Audio saved. You can play it manually.")
-                print(f"📁 Location: {audio_path}")
-        else:
-            print("❌ Failed to generate audio.")
+        # Pause background prefetching while this answer is produced
+        with _get_prefetcher().busy():
+            speak_answer(converter, _AUDIO_CACHE, answer, "qa_answer", stream)
         
-        converter.cleanup()
         return True
     else:
         print("❌ Sorry, I don't know the answer to that question.")
@@ -108,7 +185,7 @@ def answer_question(question):
         print("   • Deep Learning")
         return False
 
-def interactive_mode():
+def interactive_mode(stream=True):
     """Run in interactive question mode."""
     print("🎓 Interactive Q&A Mode")
     print("=" * 25)
@@ -116,6 +193,9 @@ def interactive_mode():
     print("Type 'help' to see example questions")
     print("Type 'quit' to exit\n")
     
+    # Cache popular answers while the user types
+    _prefetch_popular_answers()
+    
     while True:
         try:
             question = input("❓ Your question: ").strip()
@@ -140,9 +220,11 @@ def interactive_mode():
                 continue
             
             print("\n" + "─" * 50)
-            success = answer_question(question)
+            success = answer_question(question, stream=stream)
             print("─" * 50)
             
+            _prefetch_popular_answers()
+            
             if success:
                 continue_choice = input("\nAsk another question? (y/n): ").strip().lower()
                 if continue_choice != 'y':
@@ -155,18 +237,36 @@ def interactive_mode():
             print("\n👋 Goodbye!")
             break
 
+# Values accepted by --precision
+PRECISIONS = ("float32", "float16", "bfloat16")
+
 def main():
     """Main function."""
+    global _PRECISION
+    
     print("🎓 Simple Q&A Text-to-Audio System")
     print("=" * 40)
     
-    if len(sys.argv) > 1:
+    args = sys.argv[1:]
+    stream = "--no-stream" not in args
+    args = [arg for arg in args if arg != "--no-stream"]
+    
+    if "--precision" in args:
+        index = args.index("--precision")
+        _PRECISION = args[index + 1] if index + 1 < len(args) else None
+        if _PRECISION not in PRECISIONS:
+            print(f"❌ --precision must be one of: {', '.join(PRECISIONS)}")
+            print(__doc__)
+            sys.exit(2)
+        del args[index:index + 2]
+    
+    if args:
         # Command line mode
-        question = " ".join(sys.argv[1:])
-        answer_question(question)
+        question = " ".join(args)
+        answer_question(question, stream=stream)
     else:
         # Interactive mode
-        interactive_mode()
+        interactive_mode(stream=stream)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -6,11 +6,33 @@ detailed answers and converts them to audio without external dependencies.
 """
 
 import os
-import time
+import re
+import json
+import math
+import atexit
+import queue
+import hashlib
+import threading
 import subprocess
-import tempfile
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    # Plays WAV files directly instead of launching the default player
+    import winsound
+    WINSOUND_AVAILABLE = True
+except ImportError:
+    WINSOUND_AVAILABLE = False
+
+try:
+    # Calls SAPI in-process instead of going through PowerShell
+    import pyttsx3
+    PYTTSX3_AVAILABLE = True
+except ImportError:
+    PYTTSX3_AVAILABLE = False
+
 # Simple Q&A database with detailed, comprehensive answers
 QA_ANSWERS = {
     "what is artificial intelligence": """
@@ -124,144 +146,503 @@ QA_ANSWERS = {
     """,
 }
 
+# Runs of two or more periods, possibly separated by whitespace
+_REPEATED_PERIODS = re.compile(r'\.(\s*\.)+')
+
+@lru_cache(maxsize=256)
 def clean_text_for_speech(text):
     """Clean and prepare text for speech synthesis."""
     # Remove extra whitespace and formatting
     text = ' '.join(text.split())
     
-    # Replace newlines with periods for better speech flow
-    text = text.replace('\n', '. ')
-    
-    # Ensure proper sentence endings
-    text = text.replace('..', '.')
-    
-    # Remove multiple periods
-    while '. .' in text:
-        text = text.replace('. .', '.')
+    # Collapse runs of periods, with or without spaces between them
+    text = _REPEATED_PERIODS.sub('.', text)
     
     return text.strip()
 
+# Speech-ready answers, built once
+_QA_CLEAN = {key: clean_text_for_speech(answer) for key, answer in QA_ANSWERS.items()}
+
+# Positions in _QA_KEYS of the questions containing each important word
+_QA_KEYS = list(QA_ANSWERS)
+_POSTINGS = defaultdict(list)
+for _index, _key in enumerate(_QA_KEYS):
+    for _word in set(_key.split()):
+        if len(_word) > 3:
+            _POSTINGS[_word].append(_index)
+
+def _char_ngrams(text, n=3):
+    """Count the character n-grams of text, padded at word boundaries."""
+    padded = f" {text} "
+    return Counter(padded[i:i + n] for i in range(len(padded) - n + 1))
+
+# Character trigram postings and vector norms for fuzzy matching
+_NGRAM_POSTINGS = defaultdict(list)
+_NGRAM_NORMS = []
+for _index, _key in enumerate(_QA_KEYS):
+    _grams = _char_ngrams(_key)
+    for _gram, _count in _grams.items():
+        _NGRAM_POSTINGS[_gram].append((_index, _count))
+    _NGRAM_NORMS.append(math.sqrt(sum(_count * _count for _count in _grams.values())))
+
+# Minimum cosine similarity for a fuzzy match
+_FUZZY_THRESHOLD = 0.5
+
+# Questions asked before and the database question each matched, kept
+# across runs; loaded on first use
+_QUESTION_CACHE_FILE = Path("output") / "qa_cache.json"
+_QUESTION_CACHE_SIZE = 500
+_QUESTION_CACHE = None
+_QUESTION_VECTORS = {}
+_QUESTION_CACHE_DIRTY = False
+
+# Minimum cosine similarity to reuse a remembered match
+_RECALL_THRESHOLD = 0.86
+
 def find_answer(question):
     """Find the best matching answer for a question."""
-    question_clean = question.lower().strip().rstrip('?').rstrip('.')
+    key = _match_question(question)
+    return QA_ANSWERS[key] if key else None
+
+def _match_question(question):
+    """Find the database question that best matches a question."""
+    # Normalize first so case and spacing variants share a cache entry
+    question_clean = question.lower().strip().rstrip('?.').strip()
     
-    # Direct match
+    # Exact database questions always win over remembered matches
     if question_clean in QA_ANSWERS:
-        return QA_ANSWERS[question_clean]
+        return question_clean
     
-    # Partial matching - find best match
-    question_words = set(question_clean.split())
-    best_match = None
-    best_score = 0
+    # Questions like ones asked in earlier sessions reuse their match
+    key = _recall_match(question_clean)
+    if key is None:
+        key, confident = _match_normalized(question_clean)
+        # Only confident matches are worth reusing for similar questions
+        if key is not None and confident:
+            _remember_match(question_clean, key)
     
-    for key, answer in QA_ANSWERS.items():
-        key_words = set(key.split())
-        common_words = question_words.intersection(key_words)
+    return key
+
+def _vector(text):
+    """Return the trigram counts of text and their norm."""
+    grams = _char_ngrams(text)
+    return grams, math.sqrt(sum(count * count for count in grams.values()))
+
+def _load_question_cache():
+    """Return the remembered matches, reading them from disk on first use."""
+    global _QUESTION_CACHE
+    if _QUESTION_CACHE is None:
+        try:
+            with open(_QUESTION_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+        except (OSError, ValueError):
+            cached = {}
         
-        # Score based on important word matches
-        score = sum(1 for word in common_words if len(word) > 3)
+        # Keep only matches that are still confident against the database
+        _QUESTION_CACHE = {q: key for q, key in cached.items()
+                           if _match_normalized(q) == (key, True)}
+        for q in _QUESTION_CACHE:
+            _QUESTION_VECTORS[q] = _vector(q)
+    return _QUESTION_CACHE
+
+def _recall_match(question_clean):
+    """Return the match of the most similar remembered question, if close enough."""
+    cache = _load_question_cache()
+    if question_clean in cache:
+        return cache[question_clean]
+    
+    grams, norm = _vector(question_clean)
+    if not norm:
+        return None
+    
+    best_key = None
+    best_similarity = _RECALL_THRESHOLD
+    for q, (q_grams, q_norm) in _QUESTION_VECTORS.items():
+        dot = sum(count * q_grams[gram] for gram, count in grams.items() if gram in q_grams)
+        similarity = dot / (norm * q_norm)
+        if similarity >= best_similarity:
+            best_similarity = similarity
+            best_key = cache[q]
+    
+    return best_key
+
+def _remember_match(question_clean, key):
+    """Remember a question's match, evicting the oldest beyond the size limit."""
+    global _QUESTION_CACHE_DIRTY
+    cache = _load_question_cache()
+    cache[question_clean] = key
+    _QUESTION_VECTORS[question_clean] = _vector(question_clean)
+    _QUESTION_CACHE_DIRTY = True
+    
+    while len(cache) > _QUESTION_CACHE_SIZE:
+        oldest = next(iter(cache))
+        del cache[oldest]
+        del _QUESTION_VECTORS[oldest]
+
+def _save_question_cache():
+    """Write remembered matches to disk at interpreter exit."""
+    if not _QUESTION_CACHE_DIRTY:
+        return
+    try:
+        _QUESTION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with open(_QUESTION_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(_QUESTION_CACHE, f, indent=2)
+    except OSError as e:
+        print(f"⚠️ Could not save question cache: {e}")
+
+atexit.register(_save_question_cache)
+
+@lru_cache(maxsize=1024)
+def _match_normalized(question_clean):
+    """Find the database question that best matches a normalized question.
+    
+    Returns:
+        Tuple of the matched key (or None) and whether the match is
+        confident, i.e. exact, fuzzy, or a word match with no tie
+    """
+    # Direct match
+    if question_clean in QA_ANSWERS:
+        return question_clean, True
+    
+    # Partial matching - count shared important words per question
+    scores = Counter()
+    for word in set(question_clean.split()):
+        scores.update(_POSTINGS.get(word, ()))
+    
+    if not scores:
+        # No shared words; fall back to spelling similarity
+        return _fuzzy_match(question_clean), True
+    
+    # Highest score wins; ties go to the earlier question
+    (best_index, best_score), *rest = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+    tied = bool(rest) and rest[0][1] == best_score
+    return _QA_KEYS[best_index], not tied
+
+def _fuzzy_match(question_clean):
+    """Find the question most similar in spelling, if any is close enough."""
+    grams = _char_ngrams(question_clean)
+    if not grams:
+        return None
+    
+    # Dot products with every question sharing an n-gram
+    dots = defaultdict(int)
+    for gram, count in grams.items():
+        for index, key_count in _NGRAM_POSTINGS.get(gram, ()):
+            dots[index] += count * key_count
+    
+    if not dots:
+        return None
+    
+    query_norm = math.sqrt(sum(count * count for count in grams.values()))
+    best_index = max(dots, key=lambda index: (dots[index] / _NGRAM_NORMS[index], -index))
+    similarity = dots[best_index] / (query_norm * _NGRAM_NORMS[best_index])
+    
+    return _QA_KEYS[best_index] if similarity >= _FUZZY_THRESHOLD else None
+
+# In-process speech engine, used when pyttsx3 is installed
+_ENGINE = None
+
+# Long-lived PowerShell process holding a ready SpeechSynthesizer
+_SYNTH = None
+
+# Generated answers, named by a hash of the spoken text
+_CACHE_DIR = Path("output") / "cache"
+
+# Audio file path for each answer hash generated this session
+_WAV_CACHE = {}
+
+# Answers waiting to be generated and played in the background
+_AUDIO_QUEUE = queue.Queue()
+_AUDIO_THREAD = None
+
+# Set to stop the background prebuild before it submits more synthesis
+_PREBUILD_STOP = threading.Event()
+
+# Loads System.Speech and picks the preferred voice, once per process
+_SYNTH_SETUP = (
+    "Add-Type -AssemblyName System.Speech; "
+    "$speak = New-Object System.Speech.Synthesis.SpeechSynthesizer; "
+    "$speak.Rate = 0; $speak.Volume = 100; "
+    "foreach ($voice in $speak.GetInstalledVoices()) { "
+    "if ($voice.VoiceInfo.Name -like '*Zira*' -or $voice.VoiceInfo.Name -like '*David*') { "
+    "$speak.SelectVoice($voice.VoiceInfo.Name); break } }; "
+    # Speak into a WAV file, releasing it before reporting the outcome
+    "function Say($path, $text) { try { "
+    "$speak.SetOutputToWaveFile($path); $speak.Speak($text); $speak.SetOutputToNull(); "
+    "Write-Output '__TTS_OK__' "
+    "} catch { $speak.SetOutputToNull(); Write-Output ('__TTS_ERROR__ ' + $_.Exception.Message) } }"
+)
+
+def _ps_quote(value):
+    """Quote a value as a single-quoted PowerShell string."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _get_engine():
+    """Return the shared pyttsx3 engine, creating it on first use."""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = pyttsx3.init()
+        _ENGINE.setProperty('volume', 1.0)
         
-        if score > best_score:
-            best_score = score
-            best_match = answer
+        # Use the preferred voice when it is installed
+        for voice in _ENGINE.getProperty('voices'):
+            if 'Zira' in voice.name or 'David' in voice.name:
+                _ENGINE.setProperty('voice', voice.id)
+                break
+    return _ENGINE
+
+def _get_synthesizer():
+    """Return the shared PowerShell synthesizer, starting it if needed."""
+    global _SYNTH
+    if _SYNTH is None or _SYNTH.poll() is not None:
+        _SYNTH = subprocess.Popen(
+            ['powershell.exe', '-NoProfile', '-NonInteractive', '-ExecutionPolicy', 'Bypass', '-Command', '-'],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True
+        )
+        _SYNTH.stdin.write(_SYNTH_SETUP + "\n")
+        _SYNTH.stdin.flush()
+    return _SYNTH
+
+def _close_synthesizer():
+    """Stop the shared PowerShell synthesizer at interpreter exit."""
+    if _SYNTH is not None and _SYNTH.poll() is None:
+        try:
+            _SYNTH.stdin.close()
+            _SYNTH.wait(timeout=5)
+        except Exception:
+            _SYNTH.kill()
+
+atexit.register(_close_synthesizer)
+
+def _init_tts_thread():
+    """Initialize COM on the synthesis thread for the SAPI engine."""
+    if PYTTSX3_AVAILABLE and os.name == 'nt':
+        import comtypes
+        comtypes.CoInitialize()
+
+# All synthesis runs on this one thread, so the engine is always used from
+# the thread that created it and requests never interleave
+_TTS_WORKER = ThreadPoolExecutor(max_workers=1, initializer=_init_tts_thread)
+
+def _synthesize_to_file(speech_text, audio_file):
+    """Speak text into a WAV file on the synthesis thread."""
+    return _TTS_WORKER.submit(_synthesize_now, speech_text, audio_file).result()
+
+def _synthesize_now(speech_text, audio_file):
+    """Speak text into a WAV file, in-process when pyttsx3 is available."""
+    if PYTTSX3_AVAILABLE:
+        engine = _get_engine()
+        engine.save_to_file(speech_text, str(audio_file))
+        engine.runAndWait()
+        return True
     
-    return best_match if best_score > 0 else None
+    return _synthesize_with_powershell(speech_text, audio_file)
 
-def create_audio_file(text, filename="qa_audio"):
-    """Create audio file using Windows built-in text-to-speech."""
+def _synthesize_with_powershell(speech_text, audio_file):
+    """Speak text into a WAV file with the shared PowerShell synthesizer."""
+    global _SYNTH
+    
+    # One short command line per answer, handled by the Say function
+    # defined during setup
+    command = f"Say {_ps_quote(audio_file)} {_ps_quote(speech_text)}"
+    
+    synth = _get_synthesizer()
+    synth.stdin.write(command + "\n")
+    synth.stdin.flush()
+    
+    # Skip any other output until the status marker arrives
+    while True:
+        line = synth.stdout.readline()
+        if not line:
+            print("❌ PowerShell synthesizer exited unexpectedly")
+            _SYNTH = None
+            return False
+        if line.startswith('__TTS_'):
+            break
+    
+    if not line.startswith('__TTS_OK__'):
+        print(f"❌ PowerShell error: {line[len('__TTS_ERROR__'):].strip()}")
+        return False
+    
+    return True
+
+def create_audio_file(text):
+    """
+    Create audio file using Windows built-in text-to-speech.
+    
+    Files are named by a hash of the spoken text, so an answer that was
+    already synthesized is reused instead of generated again.
+    """
     try:
-        output_dir = Path("output")
-        output_dir.mkdir(exist_ok=True)
-        
-        audio_file = output_dir / f"{filename}.wav"
-        
-        # Clean text for speech
+        # Clean text for speech (also collapses it onto a single line)
         speech_text = clean_text_for_speech(text)
+        key, audio_file = _cache_entry(speech_text)
         
-        # Create PowerShell script for text-to-speech
-        ps_script = f'''
-Add-Type -AssemblyName System.Speech
-$speak = New-Object System.Speech.Synthesis.SpeechSynthesizer
-
-# Set voice properties for better quality
-$speak.Rate = 0
-$speak.Volume = 100
-
-# Get available voices and use the best one
-$voices = $speak.GetInstalledVoices()
-foreach ($voice in $voices) {{
-    if ($voice.VoiceInfo.Name -like "*Zira*" -or $voice.VoiceInfo.Name -like "*David*") {{
-        $speak.SelectVoice($voice.VoiceInfo.Name)
-        break
-    }}
-}}
-
-# Create audio file
-$speak.SetOutputToWaveFile("{str(audio_file).replace(chr(92), chr(92)+chr(92))}")
-$speak.Speak("{speech_text.replace('"', '""')}")
-$speak.SetOutputToDefaultAudioDevice()
-$speak.Dispose()
-
-Write-Host "Audio saved to: {audio_file}"
-'''
+        # Generated earlier in this session
+        if key in _WAV_CACHE:
+            print(f"♻️ Reusing audio: {audio_file.name}")
+            return _WAV_CACHE[key]
         
-        # Write PowerShell script to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.ps1', delete=False) as f:
-            f.write(ps_script)
-            ps_file = f.name
+        # Generated by an earlier run
+        if audio_file.exists():
+            print(f"♻️ Reusing audio: {audio_file.name}")
+            _WAV_CACHE[key] = str(audio_file)
+            return _WAV_CACHE[key]
         
-        try:
-            # Execute PowerShell script
-            print("🔄 Generating audio using Windows Speech Synthesis...")
-            result = subprocess.run(
-                ['powershell.exe', '-ExecutionPolicy', 'Bypass', '-File', ps_file],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                if audio_file.exists():
-                    file_size = audio_file.stat().st_size / 1024
-                    print(f"✅ Audio created: {audio_file.name} ({file_size:.1f} KB)")
-                    return str(audio_file)
-                else:
-                    print("❌ Audio file was not created")
-            else:
-                print(f"❌ PowerShell error: {result.stderr}")
-                
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(ps_file)
-            except:
-                pass
+        print("🔄 Generating audio using speech synthesis...")
+        if _build_cached_wav(speech_text, audio_file):
+            file_size = audio_file.stat().st_size / 1024
+            print(f"✅ Audio created: {audio_file.name} ({file_size:.1f} KB)")
+            _WAV_CACHE[key] = str(audio_file)
+            return _WAV_CACHE[key]
                 
     except Exception as e:
         print(f"❌ Audio generation error: {e}")
     
     return None
 
+def _cache_entry(speech_text):
+    """Return the cache key and WAV path for text to be spoken."""
+    key = hashlib.blake2b(speech_text.encode('utf-8'), digest_size=8).hexdigest()
+    return key, _CACHE_DIR / f"{key}.wav"
+
+def _build_cached_wav(speech_text, audio_file):
+    """Synthesize text into its cache file."""
+    _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    
+    # Synthesize next to the final file so a failed run never leaves
+    # a partial WAV under the cached name
+    temp_file = audio_file.with_name(audio_file.name + ".tmp")
+    if not _synthesize_to_file(speech_text, temp_file):
+        return False
+    
+    if not temp_file.exists():
+        print("❌ Audio file was not created")
+        return False
+    
+    os.replace(temp_file, audio_file)
+    return True
+
+def prebuild_cache():
+    """
+    Synthesize every canned answer that is not cached yet.
+    
+    Stops early once _PREBUILD_STOP is set.
+    
+    Returns:
+        Number of answers synthesized
+    """
+    built = 0
+    for clean_answer in _QA_CLEAN.values():
+        if _PREBUILD_STOP.is_set():
+            break
+        key, audio_file = _cache_entry(clean_answer)
+        if key in _WAV_CACHE or audio_file.exists():
+            continue
+        try:
+            if _build_cached_wav(clean_answer, audio_file):
+                _WAV_CACHE[key] = str(audio_file)
+                built += 1
+        except Exception as e:
+            print(f"⚠️ Could not prebuild audio: {e}")
+    return built
+
+@lru_cache(maxsize=16)
+def _read_wav(audio_path):
+    """Read a WAV file once; cached answer files never change."""
+    with open(audio_path, 'rb') as f:
+        return f.read()
+
 def play_audio_file(audio_path):
-    """Play audio file using Windows default player."""
+    """
+    Play audio file through the Windows sound system.
+    
+    Blocks until playback ends when winsound is available, so queued
+    answers play one after another; otherwise hands the file to the
+    default player.
+    """
+    print("🎧 Playing audio...")
+    print("💡 Listen to the complete detailed explanation!")
+    
+    if WINSOUND_AVAILABLE:
+        try:
+            winsound.PlaySound(_read_wav(str(audio_path)), winsound.SND_MEMORY | winsound.SND_NODEFAULT)
+            return True
+        except Exception as e:
+            print(f"⚠️ Direct playback failed, opening the default player: {e}")
+    
     try:
-        print("🎧 Playing audio...")
         os.startfile(audio_path)
         return True
     except Exception as e:
         print(f"❌ Could not play audio: {e}")
         return False
 
+def _speak_answer(clean_answer):
+    """Generate audio for an answer and play it."""
+    # Generate audio (reused if this answer was spoken before)
+    audio_path = create_audio_file(clean_answer)
+    
+    if audio_path:
+        print(f"✅ Audio generated successfully!")
+        
+        # Attempt to play audio
+        if not play_audio_file(audio_path):
+            print(f"💾 Audio saved to: {audio_path}")
+            print("🎧 You can double-click the file to play it.")
+
+def _audio_loop():
+    """Speak queued answers one after another."""
+    while True:
+        clean_answer = _AUDIO_QUEUE.get()
+        try:
+            _speak_answer(clean_answer)
+        except Exception as e:
+            print(f"❌ Audio error: {e}")
+        finally:
+            _AUDIO_QUEUE.task_done()
+
+def _queue_audio(clean_answer):
+    """Queue an answer to be spoken, starting the audio thread if needed."""
+    global _AUDIO_THREAD
+    if _AUDIO_THREAD is None:
+        _AUDIO_THREAD = threading.Thread(target=_audio_loop, daemon=True)
+        _AUDIO_THREAD.start()
+    _AUDIO_QUEUE.put(clean_answer)
+
+def wait_for_audio():
+    """Block until every queued answer has been generated and played."""
+    if _AUDIO_QUEUE.unfinished_tasks:
+        print("⏳ Finishing audio...")
+    _AUDIO_QUEUE.join()
+
+def stop_audio():
+    """Drop queued answers, stop the one playing and the background prebuild."""
+    _PREBUILD_STOP.set()
+    
+    while True:
+        try:
+            _AUDIO_QUEUE.get_nowait()
+        except queue.Empty:
+            break
+        _AUDIO_QUEUE.task_done()
+    
+    if WINSOUND_AVAILABLE:
+        winsound.PlaySound(None, 0)
+
 def answer_question(question):
     """Answer a question with text and audio."""
     print(f"❓ Question: {question}")
     
     # Find answer
-    answer = find_answer(question)
+    key = _match_question(question)
     
-    if answer:
-        # Clean up answer text
-        clean_answer = clean_text_for_speech(answer)
+    if key:
+        # Answer text prepared for speech at import
+        clean_answer = _QA_CLEAN[key]
         
         # Display answer preview
         preview = clean_answer[:200] + "..." if len(clean_answer) > 200 else clean_answer
@@ -269,20 +650,9 @@ def answer_question(question):
         print(f"📝 Full answer: {len(clean_answer)} characters")
         print()
         
-        # Generate audio
-        timestamp = int(time.time())
-        audio_path = create_audio_file(clean_answer, f"qa_{timestamp}")
-        
-        if audio_path:
-            print(f"✅ Audio generated successfully!")
-            
-            # Attempt to play audio
-            if play_audio_file(audio_path):
-                print("🎵 Audio is playing...")
-                print("💡 Listen to the complete detailed explanation!")
-            else:
-                print(f"💾 Audio saved to: {audio_path}")
-                print("🎧 You can double-click the file to play it.")
+        # Generate and play the audio in the background so the next
+        # question can be typed meanwhile
+        _queue_audio(clean_answer)
         
         return True
     else:
@@ -306,8 +676,10 @@ def main():
         # Command line mode
         question = " ".join(os.sys.argv[1:])
         answer_question(question)
+        wait_for_audio()
     else:
-        # Interactive mode
+        # Interactive mode; synthesize any uncached answers while the user types
+        threading.Thread(target=prebuild_cache, daemon=True).start()
         print("Enter your questions (type 'quit' to exit):")
         print()
         
@@ -337,6 +709,9 @@ def main():
             except KeyboardInterrupt:
                 print("\n👋 Goodbye!")
                 break
+        
+        # Leaving right away beats sitting through every queued answer
+        stop_audio()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -60,7 +60,7 @@ def main():
                     
                     # Try to play the audio
                     print("\n🎧 Playing audio...")
-                    play_success = converter.play_audio_file(audio_path)
+                    play_success = converter.playback_available and converter.play_audio_file(audio_path)
                     
                     if play_success:
                         print("✅ Audio played successfully!")
@@ -0,0 +1,313 @@
+"""
+Audio Cache Module
+
+This module provides a persistent, size-bounded cache of generated audio
+files so that repeated texts do not have to be synthesized again.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+import logging
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+try:
+    # diskcache provides the on-disk LRU index and eviction
+    from diskcache import Cache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+    logger.warning("diskcache not available. Audio caching will be disabled.")
+
+# TTSConfig fields that change the generated audio; worker, batch and thread
+# settings only change how fast it is produced
+AUDIO_CONFIG_FIELDS = (
+    "max_text_length",
+    "audio_format",
+    "normalize_audio",
+    "apply_fade",
+    "noise_reduction",
+    "concatenate_segments",
+    "segment_gap_ms",
+)
+
+
+class AudioCache:
+    """
+    Disk-backed LRU cache of converted audio.
+
+    Entries are keyed by a hash of the text together with the converter's
+    model and processing settings, so a cached file is only reused when it
+    would sound the same as a fresh conversion.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".tts_cache",
+        size_limit: int = 512 * 1024 * 1024,
+        enabled: bool = True
+    ):
+        """
+        Initialize the audio cache.
+
+        Args:
+            cache_dir: Directory holding the cache index and audio files
+            size_limit: Maximum total size of cached audio in bytes
+            enabled: Whether to use the cache at all
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache = None
+
+        if enabled and DISKCACHE_AVAILABLE:
+            self.cache = Cache(
+                str(self.cache_dir),
+                size_limit=size_limit,
+                eviction_policy="least-recently-used"
+            )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether cached audio can be stored and retrieved."""
+        return self.cache is not None
+
+    @staticmethod
+    def make_key(text: str, converter) -> str:
+        """
+        Build the cache key for text converted with the given converter.
+
+        Args:
+            text: Input text
+            converter: TextToAudioConverter that would perform the conversion
+
+        Returns:
+            Hex digest identifying the text and voice settings
+        """
+        settings = {
+            "model_name": converter.model_name,
+            "dtype": str(converter.tts_model.dtype),
+            "quantization": converter.tts_model.quantization,
+            **{name: getattr(converter.config, name) for name in AUDIO_CONFIG_FIELDS}
+        }
+        payload = text + json.dumps(settings, sort_keys=True)
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    def contains(self, converter, text: str) -> bool:
+        """
+        Check whether audio for the text is already cached.
+
+        Args:
+            converter: TextToAudioConverter that would perform the conversion
+            text: Input text
+
+        Returns:
+            True if a cached file exists for the text and settings
+        """
+        return self.enabled and self.make_key(text, converter) in self.cache
+
+    def get(self, key: str, output_path: Path) -> Optional[str]:
+        """
+        Copy cached audio for a key to the requested output path.
+
+        Args:
+            key: Cache key from make_key
+            output_path: Where the audio file should be written
+
+        Returns:
+            Output path if the key was cached, None otherwise
+        """
+        if not self.enabled:
+            return None
+
+        handle = self.cache.get(key, read=True)
+        if handle is None:
+            return None
+
+        with handle:
+            shutil.copyfile(handle.name, output_path)
+
+        logger.info(f"Reused cached audio for {output_path.name}")
+        return str(output_path)
+
+    def put(self, key: str, audio_path: str):
+        """
+        Store a generated audio file in the cache.
+
+        Args:
+            key: Cache key from make_key
+            audio_path: Path to the generated audio file
+        """
+        if not self.enabled:
+            return
+
+        try:
+            with open(audio_path, 'rb') as f:
+                self.cache.set(key, f, read=True)
+        except Exception as e:
+            logger.warning(f"Failed to cache audio {audio_path}: {e}")
+
+    def convert_text(self, converter, text: str, output_filename: str) -> Optional[str]:
+        """
+        Convert text with the converter, reusing cached audio when possible.
+
+        Args:
+            converter: TextToAudioConverter used on a cache miss
+            text: Input text to convert
+            output_filename: Output filename (without extension)
+
+        Returns:
+            Path to the audio file or None if conversion failed
+        """
+        key = self.make_key(text, converter)
+        output_path = converter.output_dir / f"{output_filename}.{converter.config.audio_format}"
+
+        audio_path = self.get(key, output_path)
+        if audio_path:
+            return audio_path
+
+        audio_path = converter.convert_text(text, output_filename)
+        if audio_path:
+            self.put(key, audio_path)
+
+        return audio_path
+
+    def warm(self, converter, text: str, output_filename: str) -> bool:
+        """
+        Synthesize text into the cache without keeping an output file.
+
+        Args:
+            converter: TextToAudioConverter used for synthesis
+            text: Input text to cache
+            output_filename: Temporary output filename (without extension)
+
+        Returns:
+            True if the text is cached afterwards
+        """
+        if not self.enabled:
+            return False
+
+        if self.contains(converter, text):
+            return True
+
+        audio_path = converter.convert_text(text, output_filename)
+        if not audio_path:
+            return False
+
+        self.put(self.make_key(text, converter), audio_path)
+        os.remove(audio_path)
+        return self.contains(converter, text)
+
+    def convert_batch(
+        self,
+        converter,
+        items: List[Tuple[str, str]],
+        batch_size: int = 8,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Optional[str]]:
+        """
+        Batch-convert texts, synthesizing only those missing from the cache.
+
+        Args:
+            converter: TextToAudioConverter used for cache misses
+            items: List of (text, output_filename) pairs
+            batch_size: Number of text chunks per model forward pass
+            progress_callback: Called with (chunks synthesized, total chunks)
+                as cache misses are synthesized
+
+        Returns:
+            Path to the audio file for each item, None where conversion failed
+        """
+        audio_paths = []
+        misses = []
+
+        for index, (text, output_filename) in enumerate(items):
+            key = self.make_key(text, converter)
+            output_path = converter.output_dir / f"{output_filename}.{converter.config.audio_format}"
+            audio_paths.append(self.get(key, output_path))
+            if audio_paths[-1] is None:
+                misses.append((index, key))
+
+        if misses:
+            converted = converter.convert_texts_batch(
+                [items[index] for index, _ in misses],
+                batch_size=batch_size,
+                progress_callback=progress_callback
+            )
+            for (index, key), audio_path in zip(misses, converted):
+                audio_paths[index] = audio_path
+                if audio_path:
+                    self.put(key, audio_path)
+
+        return audio_paths
+
+    def close(self):
+        """Close the cache index."""
+        if self.cache is not None:
+            self.cache.close()
+
+
+class AudioPrefetcher:
+    """
+    Synthesizes likely texts into an AudioCache in the background.
+
+    Prefetching only starts new work while the foreground is idle, so it
+    does not compete with synthesis the user is waiting for.
+    """
+
+    def __init__(self, audio_cache: AudioCache, converter, prefix: str = "prefetch"):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            audio_cache: Cache to populate
+            converter: TextToAudioConverter used for synthesis
+            prefix: Prefix for the temporary output filenames
+        """
+        self.audio_cache = audio_cache
+        self.converter = converter
+        self.prefix = prefix
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+
+    def prefetch(self, texts: Iterable[str]):
+        """
+        Start caching texts in a background thread.
+
+        Does nothing if caching is disabled or a prefetch is still running.
+
+        Args:
+            texts: Texts to cache, most likely first
+        """
+        if not self.audio_cache.enabled:
+            return
+
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(target=self._run, args=(list(texts),), daemon=True)
+        self._thread.start()
+
+    def _run(self, texts: List[str]):
+        """Cache each text in turn, waiting while the foreground is busy."""
+        for i, text in enumerate(texts, 1):
+            self._idle.wait()
+            try:
+                self.audio_cache.warm(self.converter, text, f"{self.prefix}_{i:03d}")
+            except Exception as e:
+                logger.warning(f"Prefetch failed: {e}")
+
+    @contextmanager
+    def busy(self):
+        """Pause prefetching while the foreground uses the converter."""
+        self._idle.clear()
+        try:
+            yield
+        finally:
+            self._idle.set()
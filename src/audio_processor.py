@@ -20,12 +20,15 @@ and playback functionality for the text-to-audio system.
 
 import numpy as np
 import soundfile as sf
-import librosa
+import math
+from contextlib import contextmanager
+from functools import lru_cache
 from scipy import signal
-from scipy.io import wavfile
+from scipy import fft as sfft
 import os
-import tempfile
-from typing import Optional, Union, List, Tuple, Dict, Any, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Iterator, Optional, Union, List, Tuple, Dict, Any, TYPE_CHECKING
 from pathlib import Path
 import logging
 from datetime import datetime
@@ -45,6 +48,143 @@ except ImportError:
     logger.warning("Pygame not available. Audio playback will be limited.")
 
 
+# Filter windows for each resampling quality
+RESAMPLE_WINDOWS = {
+    'kaiser_fast': ('kaiser', 5.0),
+    'kaiser_best': ('kaiser', 12.0),
+}
+
+# Gain changes smaller than this are not worth a pass over the buffer
+# (about 0.001 dB)
+NORMALIZE_TOLERANCE = 1e-4
+
+# Write buffer for streamed WAV files, so each segment is one large write
+WAV_WRITE_BUFFER = 1 << 20
+
+
+@lru_cache(maxsize=32)
+def _poly_filter(up: int, down: int, window) -> Tuple[np.ndarray, int]:
+    """
+    Design the polyphase anti-aliasing filter for a resampling ratio.
+    
+    Matches the filter resample_poly designs itself, already scaled by the
+    upsampling factor and zero-padded so output samples land at the filter
+    center, but built once per ratio instead of on every call. The taps
+    are float32 so upfirdn runs its convolution in single precision.
+    
+    Args:
+        up: Upsampling factor
+        down: Downsampling factor
+        window: Window specification for firwin
+        
+    Returns:
+        Tuple of (read-only filter taps, leading output samples to drop)
+    """
+    max_rate = max(up, down)
+    half_len = 10 * max_rate
+    taps = signal.firwin(2 * half_len + 1, 1.0 / max_rate, window=window) * up
+
+    pre_pad = down - half_len % down
+    taps = np.concatenate((np.zeros(pre_pad), taps)).astype(np.float32)
+    taps.setflags(write=False)
+    return taps, (half_len + pre_pad) // down
+
+
+@lru_cache(maxsize=32)
+def _highpass_sos(sample_rate: int, cutoff: float, order: int) -> np.ndarray:
+    """
+    Design a Butterworth high-pass filter as second-order sections.
+    
+    Args:
+        sample_rate: Audio sample rate
+        cutoff: Cutoff frequency in Hz
+        order: Filter order
+        
+    Returns:
+        Read-only second-order sections
+    """
+    sos = signal.butter(order, cutoff / (sample_rate / 2), btype='high', analog=False, output='sos')
+    sos.setflags(write=False)
+    return sos
+
+
+@lru_cache(maxsize=16)
+def _fade_ramp(length: int, rising: bool) -> np.ndarray:
+    """
+    Build a linear fade envelope, once per length and direction.
+    
+    Args:
+        length: Envelope length in samples
+        rising: True for a fade-in (0 to 1), False for a fade-out (1 to 0)
+        
+    Returns:
+        Read-only float32 envelope
+    """
+    ramp = np.linspace(0, 1, length, dtype=np.float32) if rising else np.linspace(1, 0, length, dtype=np.float32)
+    ramp.setflags(write=False)
+    return ramp
+
+
+def _float_to_pcm16(audio_data: np.ndarray) -> np.ndarray:
+    """
+    Convert float audio in [-1, 1] to int16, saturating out-of-range values.
+    
+    Args:
+        audio_data: Float32 audio array; it is overwritten as scratch space
+        
+    Returns:
+        Int16 audio array
+    """
+    np.multiply(audio_data, 32767, out=audio_data)
+    np.clip(audio_data, -32767, 32767, out=audio_data)
+    np.rint(audio_data, out=audio_data)
+    return audio_data.astype(np.int16)
+
+
+def _rms_and_peak(audio_data: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute the RMS and peak absolute level of audio.
+    
+    Uses a BLAS dot product and min/max reductions, so no array the size
+    of the input is allocated.
+    
+    Args:
+        audio_data: Non-empty audio array of any shape
+        
+    Returns:
+        Tuple of (rms, peak)
+    """
+    sum_of_squares = float(np.vdot(audio_data, audio_data))
+    rms = np.sqrt(sum_of_squares / audio_data.size)
+    peak = max(float(audio_data.max()), -float(audio_data.min()))
+    return rms, peak
+
+
+def _normalization_factor(rms: float, peak: float, target_level: float) -> float:
+    """
+    Compute the gain that brings audio to a target RMS level without clipping.
+    
+    Args:
+        rms: RMS level of the audio
+        peak: Peak absolute level of the audio
+        target_level: Target level in dB
+        
+    Returns:
+        Gain factor, 1.0 for silent audio
+    """
+    if rms <= 0:
+        return 1.0
+    
+    target_rms = 10 ** (target_level / 20)
+    normalization_factor = target_rms / rms
+    
+    # Prevent clipping: scale the peak to exactly 1.0 instead
+    if normalization_factor * peak > 1.0:
+        normalization_factor = 1.0 / peak
+    
+    return normalization_factor
+
+
 class AudioProcessor:
     """
     Comprehensive audio processing class for handling TTS output.
@@ -75,6 +215,16 @@ class AudioProcessor:
             'ogg': 'OGG'
         }
         
+        # Sound currently playing, kept alive until the next one starts
+        self._current_sound = None
+        
+        # Sample rates the mixer failed to open at, played via resampling
+        self._unsupported_mixer_rates = set()
+        
+        # Reused scratch buffers for PCM conversion in play_audio
+        self._pcm_float = np.empty(0, dtype=np.float32)
+        self._pcm_int16 = np.empty(0, dtype=np.int16)
+        
         # Initialize pygame mixer for playback
         if PYGAME_AVAILABLE:
             try:
@@ -93,7 +243,9 @@ class AudioProcessor:
         filename: str,
         sample_rate: int = 16000,
         format: str = 'wav',
-        normalize: bool = True
+        normalize: bool = True,
+        subtype: Optional[str] = None,
+        in_place: bool = False
     ) -> str:
         """
         Save audio data to file.
@@ -104,6 +256,10 @@ class AudioProcessor:
             sample_rate: Audio sample rate
             format: Output format ('wav', 'mp3', 'flac', 'ogg')
             normalize: Whether to normalize audio
+            subtype: soundfile sample subtype; defaults to 'PCM_16' for WAV
+                and FLAC and to the format's default otherwise
+            in_place: Use float32 audio_data as scratch space for
+                normalization and PCM conversion instead of copying it
             
         Returns:
             Path to saved file
@@ -111,12 +267,16 @@ class AudioProcessor:
         if audio_data is None or len(audio_data) == 0:
             raise ValueError("No audio data provided")
         
-        # Ensure audio data is in the right format
-        audio_data = np.array(audio_data, dtype=np.float32)
+        # Ensure audio data is in the right format; work on a private copy
+        # unless the caller hands the buffer over
+        if in_place:
+            audio_data = np.asarray(audio_data, dtype=np.float32)
+        else:
+            audio_data = np.array(audio_data, dtype=np.float32)
         
         # Normalize audio if requested
         if normalize:
-            audio_data = self.normalize_audio(audio_data)
+            audio_data = self.normalize_audio(audio_data, in_place=True)
         
         # Ensure filename has no extension
         filename = Path(filename).stem
@@ -124,14 +284,126 @@ class AudioProcessor:
         # Create full output path
         output_path = self.output_dir / f"{filename}.{format}"
         
+        if subtype is None and format.lower() in ('wav', 'flac'):
+            subtype = 'PCM_16'
+        
+        # Hand 16-bit files int16 samples, converted once with saturation,
+        # so soundfile writes half the bytes and never wraps on overflow
+        if subtype == 'PCM_16':
+            audio_data = _float_to_pcm16(audio_data)
+        
         try:
             if format.lower() == 'wav':
                 # Use soundfile for WAV
-                sf.write(str(output_path), audio_data, sample_rate)
+                sf.write(str(output_path), audio_data, sample_rate, subtype=subtype)
             else:
                 # Use soundfile for other formats too
-                sf.write(str(output_path), audio_data, sample_rate, format=format.upper())
+                sf.write(str(output_path), audio_data, sample_rate, subtype=subtype, format=format.upper())
+            
+            logger.info(f"Audio saved to: {output_path}")
+            return str(output_path)
+            
+        except Exception as e:
+            logger.error(f"Failed to save audio: {e}")
+            raise
+    
+    @contextmanager
+    def open_wav_writer(
+        self,
+        filename: str,
+        sample_rate: int = 16000,
+        subtype: str = 'PCM_16'
+    ) -> Iterator[sf.SoundFile]:
+        """
+        Open a mono WAV file in the output directory for incremental writes.
+        
+        Args:
+            filename: Output filename (without extension)
+            sample_rate: Audio sample rate
+            subtype: soundfile sample subtype
+            
+        Yields:
+            Writable SoundFile backed by a buffered file
+        """
+        output_path = self.output_dir / f"{Path(filename).stem}.wav"
+        
+        with open(output_path, 'wb', buffering=WAV_WRITE_BUFFER) as f:
+            with sf.SoundFile(
+                f, 'w', samplerate=sample_rate, channels=1,
+                subtype=subtype, format='WAV'
+            ) as writer:
+                yield writer
+    
+    def save_segments(
+        self,
+        audio_segments: List[np.ndarray],
+        filename: str,
+        sample_rate: int = 16000,
+        gap_ms: int = 500,
+        normalize: bool = True,
+        fade_in_ms: int = 0,
+        fade_out_ms: int = 0
+    ) -> str:
+        """
+        Save segments separated by silent gaps as one 16-bit WAV file.
+        
+        Writes the same file as concatenating the segments, fading the
+        result and saving it, but streams each segment to disk so no array
+        of the full duration is built. The segments are used as scratch
+        space and are overwritten.
+        
+        Args:
+            audio_segments: Non-empty list of 1D audio arrays
+            filename: Output filename (without extension)
+            sample_rate: Audio sample rate
+            gap_ms: Gap between segments in milliseconds
+            normalize: Whether to normalize the combined audio
+            fade_in_ms: Fade-in duration at the start, in milliseconds
+            fade_out_ms: Fade-out duration at the end, in milliseconds
+            
+        Returns:
+            Path to saved file
+        """
+        if not audio_segments:
+            raise ValueError("No audio data provided")
+        
+        segments = [np.asarray(segment, dtype=np.float32) for segment in audio_segments]
+        gap_samples = int(gap_ms * sample_rate / 1000)
+        
+        # Fades only touch the first and last segments
+        if fade_in_ms > 0:
+            self.apply_fade(segments[0], fade_in_ms, 0, sample_rate, in_place=True)
+        if fade_out_ms > 0:
+            self.apply_fade(segments[-1], 0, fade_out_ms, sample_rate, in_place=True)
+        
+        # Level of the combined audio; the silent gaps only add length
+        normalization_factor = 1.0
+        if normalize:
+            total_samples = sum(segment.size for segment in segments)
+            total_samples += gap_samples * (len(segments) - 1)
+            sum_of_squares = 0.0
+            peak = 0.0
+            for segment in segments:
+                if segment.size:
+                    sum_of_squares += float(np.vdot(segment, segment))
+                    peak = max(peak, float(segment.max()), -float(segment.min()))
+            rms = np.sqrt(sum_of_squares / total_samples) if total_samples else 0.0
+            normalization_factor = _normalization_factor(rms, peak, -3.0)
+            if abs(normalization_factor - 1.0) < NORMALIZE_TOLERANCE:
+                normalization_factor = 1.0
+        
+        gap = np.zeros(gap_samples, dtype=np.int16)
+        
+        try:
+            with self.open_wav_writer(filename, sample_rate) as writer:
+                for i, segment in enumerate(segments):
+                    if i > 0 and gap_samples:
+                        writer.write(gap)
+                    if normalization_factor != 1.0:
+                        np.multiply(segment, normalization_factor, out=segment)
+                    writer.write(_float_to_pcm16(segment))
             
+            output_path = self.output_dir / f"{Path(filename).stem}.wav"
             logger.info(f"Audio saved to: {output_path}")
             return str(output_path)
             
@@ -157,13 +429,48 @@ class AudioProcessor:
             logger.error(f"Failed to load audio from {file_path}: {e}")
             raise
     
-    def normalize_audio(self, audio_data: np.ndarray, target_level: float = -3.0) -> np.ndarray:
+    def stream_audio(
+        self,
+        file_path: str,
+        block_seconds: float = 30.0
+    ) -> Iterator[Tuple[np.ndarray, int]]:
+        """
+        Read an audio file in consecutive blocks instead of all at once.
+        
+        Memory use is bounded by the block size, so arbitrarily long files
+        can be processed. Blocks do not overlap; any state that must carry
+        across block boundaries is the caller's responsibility.
+        
+        Args:
+            file_path: Path to audio file
+            block_seconds: Length of each block in seconds
+            
+        Yields:
+            Tuples of (audio_block, sample_rate)
+        """
+        try:
+            with sf.SoundFile(file_path) as f:
+                block_size = max(1, int(block_seconds * f.samplerate))
+                for block in f.blocks(blocksize=block_size, dtype='float32', always_2d=False):
+                    yield block, f.samplerate
+        except Exception as e:
+            logger.error(f"Failed to stream audio from {file_path}: {e}")
+            raise
+    
+    def normalize_audio(
+        self,
+        audio_data: np.ndarray,
+        target_level: float = -3.0,
+        in_place: bool = False
+    ) -> np.ndarray:
         """
         Normalize audio to target loudness level.
         
         Args:
             audio_data: Input audio array
             target_level: Target level in dB
+            in_place: Scale audio_data itself (must be a float array)
+                instead of returning a new array
             
         Returns:
             Normalized audio array
@@ -171,32 +478,27 @@ class AudioProcessor:
         if len(audio_data) == 0:
             return audio_data
         
-        # Calculate RMS
-        rms = np.sqrt(np.mean(audio_data ** 2))
+        # Calculate RMS and peak without temporary arrays
+        rms, peak = _rms_and_peak(audio_data)
+        normalization_factor = _normalization_factor(rms, peak, target_level)
         
-        if rms > 0:
-            # Calculate normalization factor
-            target_rms = 10 ** (target_level / 20)
-            normalization_factor = target_rms / rms
-            
-            # Apply normalization
-            normalized = audio_data * normalization_factor
-            
-            # Prevent clipping
-            max_val = np.max(np.abs(normalized))
-            if max_val > 1.0:
-                normalized = normalized / max_val
-            
-            return normalized
-        else:
+        # Silent, or already at the target level (e.g. normalized earlier in
+        # the pipeline): skip the full-buffer multiply
+        if abs(normalization_factor - 1.0) < NORMALIZE_TOLERANCE:
             return audio_data
+        
+        # Apply normalization in a single multiply
+        if in_place:
+            return np.multiply(audio_data, normalization_factor, out=audio_data)
+        return audio_data * normalization_factor
     
     def apply_fade(
         self, 
         audio_data: np.ndarray, 
         fade_in_ms: int = 50, 
         fade_out_ms: int = 50,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        in_place: bool = False
     ) -> np.ndarray:
         """
         Apply fade-in and fade-out to audio.
@@ -206,6 +508,7 @@ class AudioProcessor:
             fade_in_ms: Fade-in duration in milliseconds
             fade_out_ms: Fade-out duration in milliseconds
             sample_rate: Audio sample rate
+            in_place: Apply the fades to audio_data itself instead of a copy
             
         Returns:
             Audio with fades applied
@@ -213,7 +516,7 @@ class AudioProcessor:
         if len(audio_data) == 0:
             return audio_data
         
-        audio_copy = audio_data.copy()
+        audio_copy = audio_data if in_place else audio_data.copy()
         
         # Calculate fade lengths in samples
         fade_in_samples = int(fade_in_ms * sample_rate / 1000)
@@ -221,13 +524,11 @@ class AudioProcessor:
         
         # Apply fade-in
         if fade_in_samples > 0 and fade_in_samples < len(audio_copy):
-            fade_in = np.linspace(0, 1, fade_in_samples)
-            audio_copy[:fade_in_samples] *= fade_in
+            audio_copy[:fade_in_samples] *= _fade_ramp(fade_in_samples, True)
         
         # Apply fade-out
         if fade_out_samples > 0 and fade_out_samples < len(audio_copy):
-            fade_out = np.linspace(1, 0, fade_out_samples)
-            audio_copy[-fade_out_samples:] *= fade_out
+            audio_copy[-fade_out_samples:] *= _fade_ramp(fade_out_samples, False)
         
         return audio_copy
     
@@ -235,7 +536,8 @@ class AudioProcessor:
         self, 
         audio_data: np.ndarray, 
         original_rate: int, 
-        target_rate: int
+        target_rate: int,
+        res_type: str = 'kaiser_fast'
     ) -> np.ndarray:
         """
         Resample audio to target sample rate.
@@ -244,6 +546,8 @@ class AudioProcessor:
             audio_data: Input audio array
             original_rate: Original sample rate
             target_rate: Target sample rate
+            res_type: 'kaiser_fast' for speech output, or 'kaiser_best' for
+                stronger alias rejection
             
         Returns:
             Resampled audio array
@@ -252,11 +556,21 @@ class AudioProcessor:
             return audio_data
         
         try:
-            resampled = librosa.resample(
-                audio_data, 
-                orig_sr=original_rate, 
-                target_sr=target_rate
+            # Polyphase filtering at the reduced integer ratio with cached taps
+            g = math.gcd(original_rate, target_rate)
+            up, down = target_rate // g, original_rate // g
+            taps, skip = _poly_filter(up, down, RESAMPLE_WINDOWS[res_type])
+
+            n_out = -(-len(audio_data) * up // down)
+            filtered = signal.upfirdn(
+                taps, np.asarray(audio_data, dtype=np.float32), up, down, axis=0
             )
+            resampled = filtered[skip:skip + n_out]
+
+            # The filter tail past the input is silence; pad if it fell short
+            if len(resampled) < n_out:
+                pad = [(0, n_out - len(resampled))] + [(0, 0)] * (resampled.ndim - 1)
+                resampled = np.pad(resampled, pad)
             logger.info(f"Resampled audio from {original_rate}Hz to {target_rate}Hz")
             return resampled
         except Exception as e:
@@ -285,15 +599,11 @@ class AudioProcessor:
         
         try:
             # Simple high-pass filter to reduce low-frequency noise
-            nyquist = sample_rate / 2
             cutoff = 80  # Hz
-            normalized_cutoff = cutoff / nyquist
             
-            # Design high-pass filter
-            b, a = signal.butter(4, normalized_cutoff, btype='high', analog=False)
-            
-            # Apply filter
-            filtered_audio = signal.filtfilt(b, a, audio_data)
+            # Zero-phase IIR filtering; runs in linear time at any length
+            sos = _highpass_sos(sample_rate, cutoff, 4)
+            filtered_audio = signal.sosfiltfilt(sos, audio_data)
             
             # Blend with original based on strength
             result = (1 - strength) * audio_data + strength * filtered_audio
@@ -304,11 +614,43 @@ class AudioProcessor:
             logger.warning(f"Noise reduction failed: {e}")
             return audio_data
     
+    def convolve_ir(
+        self,
+        audio_data: np.ndarray,
+        impulse_response: np.ndarray,
+        mode: str = 'full'
+    ) -> np.ndarray:
+        """
+        Convolve audio with an impulse response (reverb, EQ, room effects).
+        
+        Uses overlap-add FFT convolution, which costs O(N log M) instead of
+        the O(N * M) of direct convolution, so long responses stay cheap.
+        
+        Args:
+            audio_data: Input audio array
+            impulse_response: Impulse response taps
+            mode: 'full' to keep the response tail, or 'same' to keep the
+                input length
+        
+        Returns:
+            Convolved audio array
+        """
+        if len(audio_data) == 0 or len(impulse_response) == 0:
+            return audio_data
+        
+        with sfft.set_workers(-1):
+            return signal.oaconvolve(
+                audio_data.astype(np.float32, copy=False),
+                np.asarray(impulse_response, dtype=np.float32),
+                mode=mode
+            )
+    
     def concatenate_audio(
         self, 
         audio_segments: List[np.ndarray], 
         gap_ms: int = 500,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        out: Optional[np.ndarray] = None
     ) -> np.ndarray:
         """
         Concatenate multiple audio segments with gaps.
@@ -317,6 +659,8 @@ class AudioProcessor:
             audio_segments: List of audio arrays to concatenate
             gap_ms: Gap between segments in milliseconds
             sample_rate: Audio sample rate
+            out: Optional preallocated buffer to write into; used when it
+                is large enough, and the returned array is a view of it
             
         Returns:
             Concatenated audio array
@@ -329,23 +673,41 @@ class AudioProcessor:
         
         # Calculate gap length in samples
         gap_samples = int(gap_ms * sample_rate / 1000)
-        gap_audio = np.zeros(gap_samples, dtype=np.float32)
         
-        # Concatenate with gaps
-        result = audio_segments[0]
+        # Size the result once; write into the caller's buffer when it can
+        # hold it
+        total_samples = sum(len(segment) for segment in audio_segments)
+        total_samples += gap_samples * (len(audio_segments) - 1)
         
-        for segment in audio_segments[1:]:
-            result = np.concatenate([result, gap_audio, segment])
+        if out is not None and len(out) >= total_samples:
+            result = out[:total_samples]
+        else:
+            result = np.empty(total_samples, dtype=np.result_type(*audio_segments))
+        
+        # Fill each segment and gap in place, copying every sample once
+        position = 0
+        for i, segment in enumerate(audio_segments):
+            if i > 0:
+                result[position:position + gap_samples] = 0
+                position += gap_samples
+            result[position:position + len(segment)] = segment
+            position += len(segment)
         
         return result
     
-    def play_audio(self, audio_data: np.ndarray, sample_rate: int = 16000) -> bool:
+    def play_audio(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        blocking: bool = False
+    ) -> bool:
         """
         Play audio using pygame.
         
         Args:
             audio_data: Audio array to play
             sample_rate: Audio sample rate
+            blocking: Wait until playback has finished before returning
             
         Returns:
             True if playback started successfully, False otherwise
@@ -363,34 +725,45 @@ class AudioProcessor:
             # Ensure audio is 1D
             audio_data = audio_data.flatten()
             
-            # Normalize audio to prevent clipping
-            if np.max(np.abs(audio_data)) > 0:
-                audio_data = audio_data / np.max(np.abs(audio_data)) * 0.95
+            # Reinitialize pygame mixer only when its format does not match,
+            # and not again for a rate it has already failed to open at
+            mixer_init = pygame.mixer.get_init()
+            if mixer_init != (sample_rate, -16, 1) and not (
+                mixer_init and sample_rate in self._unsupported_mixer_rates
+            ):
+                try:
+                    pygame.mixer.quit()
+                    pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=1024)
+                except pygame.error:
+                    self._unsupported_mixer_rates.add(sample_rate)
+                    pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=1024)
             
-            # Convert to 16-bit integers
-            audio_int16 = (audio_data * 32767).astype(np.int16)
+            # Resample to whatever rate the mixer actually opened at, so the
+            # audio plays at the right speed and pitch
+            mixer_rate = pygame.mixer.get_init()[0]
+            if mixer_rate != sample_rate:
+                resampled = self.resample_audio(audio_data, sample_rate, mixer_rate)
+                if resampled is audio_data:
+                    logger.error(f"Cannot play {sample_rate}Hz audio on a {mixer_rate}Hz mixer")
+                    return False
+                audio_data = resampled
             
-            # Create temporary WAV file
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as temp_file:
-                wavfile.write(temp_file.name, sample_rate, audio_int16)
-                temp_path = temp_file.name
+            # Normalize the peak to 0.95 of full scale while converting to
+            # 16-bit integers
+            peak = max(float(audio_data.max()), -float(audio_data.min())) if audio_data.size else 0.0
+            scale = 0.95 * 32767 / peak if peak > 0 else 32767.0
+            audio_int16 = self._to_pcm16(audio_data, scale)
             
-            # Reinitialize pygame mixer with correct settings
-            try:
-                pygame.mixer.quit()
-                pygame.mixer.init(frequency=sample_rate, size=-16, channels=1, buffer=1024)
-            except:
-                pygame.mixer.init(frequency=22050, size=-16, channels=1, buffer=1024)
-            
-            # Play using pygame
-            pygame.mixer.music.load(temp_path)
-            pygame.mixer.music.play()
+            # Play the samples straight from memory; keep a reference so
+            # the sound is not collected while it plays
+            self._current_sound = pygame.sndarray.make_sound(audio_int16)
+            channel = self._current_sound.play()
             
             logger.info("Audio playback started successfully")
             
-            # Wait a moment for playback to start
-            import time
-            time.sleep(0.1)
+            if blocking:
+                while channel is not None and channel.get_busy():
+                    time.sleep(0.05)
             
             return True
             
@@ -398,6 +771,31 @@ class AudioProcessor:
             logger.error(f"Audio playback failed: {e}")
             return False
     
+    def _to_pcm16(self, audio_data: np.ndarray, scale: float) -> np.ndarray:
+        """
+        Scale audio into reused int16 buffers, saturating instead of wrapping.
+        
+        Args:
+            audio_data: 1D float audio array
+            scale: Factor mapping audio values to int16 sample values
+            
+        Returns:
+            View of the int16 buffer holding the converted samples
+        """
+        n = audio_data.size
+        if self._pcm_float.size < n:
+            self._pcm_float = np.empty(n, dtype=np.float32)
+            self._pcm_int16 = np.empty(n, dtype=np.int16)
+        
+        scaled = self._pcm_float[:n]
+        np.multiply(audio_data, scale, out=scaled)
+        np.clip(scaled, -32767, 32767, out=scaled)
+        np.rint(scaled, out=scaled)
+        
+        pcm = self._pcm_int16[:n]
+        pcm[...] = scaled
+        return pcm
+    
     def get_audio_info(self, audio_data: np.ndarray, sample_rate: int) -> Dict[str, Any]:
         """
         Get information about audio data.
@@ -413,8 +811,7 @@ class AudioProcessor:
             return {"error": "No audio data"}
         
         duration = len(audio_data) / sample_rate
-        rms = np.sqrt(np.mean(audio_data ** 2))
-        peak = np.max(np.abs(audio_data))
+        rms, peak = _rms_and_peak(audio_data)
         
         info = {
             "duration_seconds": duration,
@@ -434,7 +831,8 @@ class AudioProcessor:
         audio_segments: List[np.ndarray],
         sample_rate: int,
         output_prefix: str = "audio",
-        processing_options: Optional[Dict[str, Any]] = None
+        processing_options: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None
     ) -> List[str]:
         """
         Process and save multiple audio segments.
@@ -444,6 +842,8 @@ class AudioProcessor:
             sample_rate: Audio sample rate
             output_prefix: Prefix for output filenames
             processing_options: Dictionary with processing options
+            max_workers: Number of worker threads (defaults to one per CPU,
+                capped at the number of segments)
             
         Returns:
             List of output file paths
@@ -455,12 +855,15 @@ class AudioProcessor:
         noise_reduction = options.get('noise_reduction', False)
         format = options.get('format', 'wav')
         
-        output_paths = []
+        # One timestamp for the whole batch; the index keeps names unique
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        for i, audio in enumerate(audio_segments):
+        def process_one(i, audio):
             try:
-                # Apply processing
-                processed_audio = audio.copy()
+                # Apply processing; noise reduction already returns a new
+                # array, so copy only when later stages would otherwise
+                # modify the caller's segment
+                processed_audio = audio
                 
                 if noise_reduction:
                     processed_audio = self.apply_noise_reduction(
@@ -469,27 +872,38 @@ class AudioProcessor:
                 
                 if apply_fade:
                     processed_audio = self.apply_fade(
-                        processed_audio, sample_rate=sample_rate
+                        processed_audio,
+                        sample_rate=sample_rate,
+                        in_place=processed_audio is not audio
                     )
                 
                 # Generate filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"{output_prefix}_{i+1:03d}_{timestamp}"
                 
                 # Save audio
-                output_path = self.save_audio(
+                return self.save_audio(
                     processed_audio,
                     filename,
                     sample_rate,
                     format,
-                    normalize
+                    normalize,
+                    in_place=processed_audio is not audio
                 )
                 
-                output_paths.append(output_path)
-                
             except Exception as e:
                 logger.error(f"Failed to process audio segment {i+1}: {e}")
-                continue
+                return None
+        
+        # Segments are independent, and filtering and file writes release
+        # the GIL, so threads process them in parallel
+        if not audio_segments:
+            return []
+        
+        workers = max_workers or min(len(audio_segments), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(process_one, range(len(audio_segments)), audio_segments))
+        
+        output_paths = [path for path in results if path is not None]
         
         logger.info(f"Processed {len(output_paths)} audio segments")
         return output_paths
@@ -527,12 +941,13 @@ def main():
     processed_audio = processor.apply_fade(sample_audio, sample_rate=sample_rate)
     processed_audio = processor.normalize_audio(processed_audio)
     
-    # Save audio
+    # Save audio (already normalized above)
     output_path = processor.save_audio(
         processed_audio, 
         "sample_audio", 
         sample_rate,
-        format='wav'
+        format='wav',
+        normalize=False
     )
     
     print(f"Audio saved to: {output_path}")
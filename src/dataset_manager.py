@@ -6,23 +6,175 @@ and fine-tuning, including LJSpeech, LibriTTS, and custom datasets.
 """
 
 import os
+import io
 import json
+import math
+import multiprocessing
+import queue
+import threading
 import csv
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Union
-from datasets import Dataset, DatasetDict, load_dataset
-import torchaudio
-import torch
+from typing import Iterator, List, Dict, Any, Optional, Tuple, Union, TYPE_CHECKING
 import numpy as np
+import soundfile as sf
 import logging
-from urllib.request import urlopen
-import tarfile
-import zipfile
-import shutil
+
+# datasets and pyarrow are imported where they are used, so importing this
+# module (e.g. just to list the available datasets) stays fast
+if TYPE_CHECKING:
+    from datasets import Dataset, DatasetDict
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+try:
+    # Faster JSON parsing/serialization when available
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Shared generator for statistics sampling; leaves NumPy's global state alone
+_RNG = np.random.default_rng()
+
+# Mapping files at least this large are parsed with pyarrow.csv
+CSV_ARROW_MIN_BYTES = 1024 * 1024
+
+# Approximate in-memory size of each Parquet shard written by save_dataset
+PARQUET_SHARD_BYTES = 512 * 1024 * 1024
+
+# Number of contiguous row blocks sampled separately for audio statistics
+STATS_STRATA = 10
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON from raw bytes, with orjson when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to JSON bytes, converting NumPy scalars to Python numbers."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=lambda value: value.item(), option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=lambda value: value.item()).encode('utf-8')
+
+
+def _save_ljspeech_item(item: Tuple[int, np.ndarray, int, str], wavs_dir: Path) -> Tuple[str, str]:
+    """
+    Write one LJSpeech clip to disk.
+    
+    Runs in a worker process, so it only receives plain arrays and strings.
+    
+    Args:
+        item: Tuple of (index, audio array, sample rate, normalized text)
+        wavs_dir: Directory for the WAV files
+        
+    Returns:
+        Tuple of (file id, normalized text) for the metadata row
+    """
+    i, audio_data, sample_rate, normalized_text = item
+    
+    file_id = f"LJ{i+1:03d}-{i+1:04d}"
+    audio_path = wavs_dir / f"{file_id}.wav"
+    
+    # Write 16-bit PCM straight through libsndfile; the worker owns its
+    # copy of the samples, so they are scaled in place
+    np.multiply(audio_data, 32767.0, out=audio_data)
+    np.clip(audio_data, -32768, 32767, out=audio_data)
+    np.rint(audio_data, out=audio_data)
+    sf.write(str(audio_path), audio_data.astype(np.int16), sample_rate, subtype='PCM_16')
+    
+    return file_id, normalized_text
+
+
+def _stratified_sample(
+    num_rows: int,
+    sample_size: int,
+    num_strata: int,
+    rng: np.random.Generator
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Sample row indices without replacement from equal contiguous blocks.
+    
+    Each block contributes samples in proportion to its size (at least one),
+    so clusters of long or short clips in one part of the dataset cannot
+    dominate the sample.
+    
+    Args:
+        num_rows: Number of rows in the dataset
+        sample_size: Approximate total number of indices to draw
+        num_strata: Number of blocks to split the rows into
+        rng: Random generator to draw with
+        
+    Yields:
+        Tuples of (rows in the block, sampled indices within the block)
+    """
+    num_strata = max(1, min(num_strata, sample_size))
+    bounds = np.linspace(0, num_rows, num_strata + 1).astype(int)
+    
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        stratum_size = int(stop - start)
+        if stratum_size == 0:
+            continue
+        count = min(stratum_size, max(1, round(sample_size * stratum_size / num_rows)))
+        yield stratum_size, start + rng.choice(stratum_size, count, replace=False)
+
+
+def _log_progress(rows, every: int = 100):
+    """Pass rows through, logging a count every `every` audio files."""
+    for i, row in enumerate(rows, 1):
+        if i % every == 0:
+            logger.info(f"Processed {i} audio files")
+        yield row
+
+
+def _prefetch(iterable, maxsize: int):
+    """
+    Iterate in a background thread, keeping up to `maxsize` items ready.
+    
+    Exceptions raised while iterating are re-raised in the consumer.
+    """
+    buffer = queue.Queue(maxsize=maxsize)
+    done = object()
+    
+    def produce():
+        try:
+            for item in iterable:
+                buffer.put(item)
+        except BaseException as e:
+            buffer.put(e)
+        buffer.put(done)
+    
+    threading.Thread(target=produce, daemon=True).start()
+    
+    while True:
+        item = buffer.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def _bounded_map(executor, fn, iterable, chunksize: int, window: int):
+    """
+    Like executor.map, but only pulls `window` items ahead of the results.
+    
+    Executor.map submits the whole iterable up front, which would hold every
+    decoded clip in memory at once.
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, window))
+        if not batch:
+            return
+        yield from executor.map(fn, batch, chunksize=chunksize)
+
 
 class DatasetManager:
     """
@@ -35,15 +187,18 @@ class DatasetManager:
     - Custom datasets
     """
     
-    def __init__(self, data_dir: str = "data"):
+    def __init__(self, data_dir: str = "data", enable_stats_cache: bool = True):
         """
         Initialize the dataset manager.
         
         Args:
             data_dir: Directory to store datasets
+            enable_stats_cache: Whether to keep computed dataset statistics
+                on disk, keyed by dataset fingerprint
         """
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.enable_stats_cache = enable_stats_cache
         
         # Dataset configurations
         self.dataset_configs = {
@@ -74,6 +229,9 @@ class DatasetManager:
         }
         
         self.loaded_datasets = {}
+        
+        # Full Hugging Face datasets, opened once per manager
+        self._hf_datasets = {}
     
     def list_available_datasets(self) -> Dict[str, Dict[str, Any]]:
         """List all available datasets with their configurations."""
@@ -98,8 +256,11 @@ class DatasetManager:
         try:
             logger.info("Downloading LJSpeech dataset...")
             
-            # Download using Hugging Face datasets (easier and more reliable)
-            dataset = load_dataset("lj_speech", split="train")
+            from datasets import load_dataset
+            
+            # Download using Hugging Face datasets (easier and more reliable);
+            # stream it, since each clip is only needed once on its way to disk
+            dataset = load_dataset("lj_speech", split="train", streaming=True)
             
             # Create directory structure
             dataset_path.mkdir(parents=True, exist_ok=True)
@@ -109,27 +270,35 @@ class DatasetManager:
             # Save metadata
             metadata_path = dataset_path / "metadata.csv"
             
-            with open(metadata_path, 'w', newline='', encoding='utf-8') as f:
+            # Hand each clip to a worker process; encoding and writing the
+            # WAVs is independent per clip, and map keeps metadata in order.
+            # A background thread fetches and decodes rows meanwhile, so
+            # workers are spawned rather than forked from a threaded process.
+            items = _prefetch((
+                (i, np.asarray(item['audio']['array'], dtype=np.float32),
+                 item['audio']['sampling_rate'], item['normalized_text'])
+                for i, item in enumerate(dataset)
+            ), maxsize=64)
+            workers = os.cpu_count() or 1
+            
+            with open(metadata_path, 'w', newline='', encoding='utf-8') as f, \
+                    ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    ) as executor:
                 writer = csv.writer(f, delimiter='|')
+                saved = _bounded_map(
+                    executor,
+                    partial(_save_ljspeech_item, wavs_dir=wavs_dir),
+                    items,
+                    chunksize=8,
+                    window=workers * 8 * 4
+                )
                 
-                for i, item in enumerate(dataset):
-                    # Save audio file
-                    audio_data = item['audio']['array']
-                    sample_rate = item['audio']['sampling_rate']
-                    
-                    audio_filename = f"LJ{i+1:03d}-{i+1:04d}.wav"
-                    audio_path = wavs_dir / audio_filename
-                    
-                    # Convert to tensor and save
-                    audio_tensor = torch.tensor(audio_data, dtype=torch.float32)
-                    torchaudio.save(str(audio_path), audio_tensor.unsqueeze(0), sample_rate)
-                    
-                    # Write metadata
-                    normalized_text = item['normalized_text']
-                    writer.writerow([audio_filename.replace('.wav', ''), normalized_text, normalized_text])
-                    
-                    if (i + 1) % 100 == 0:
-                        logger.info(f"Processed {i + 1} audio files")
+                # Write metadata rows as the clips complete
+                writer.writerows(_log_progress(
+                    (file_id, text, text) for file_id, text in saved
+                ))
             
             logger.info(f"LJSpeech dataset downloaded and saved to {dataset_path}")
             return True
@@ -138,7 +307,7 @@ class DatasetManager:
             logger.error(f"Failed to download LJSpeech dataset: {e}")
             return False
     
-    def load_ljspeech(self, max_samples: Optional[int] = None) -> Optional[Dataset]:
+    def load_ljspeech(self, max_samples: Optional[int] = None) -> Optional["Dataset"]:
         """
         Load the LJSpeech dataset.
         
@@ -152,7 +321,7 @@ class DatasetManager:
             logger.info("Loading LJSpeech dataset...")
             
             # Load from Hugging Face for simplicity
-            dataset = load_dataset("lj_speech", split="train")
+            dataset = self._load_hf_dataset("lj_speech")
             
             if max_samples:
                 dataset = dataset.select(range(min(max_samples, len(dataset))))
@@ -171,7 +340,7 @@ class DatasetManager:
         self, 
         subset: str = "train-clean-100", 
         max_samples: Optional[int] = None
-    ) -> Optional[Dataset]:
+    ) -> Optional["Dataset"]:
         """
         Load the LibriTTS dataset.
         
@@ -186,7 +355,7 @@ class DatasetManager:
             logger.info(f"Loading LibriTTS dataset (subset: {subset})...")
             
             # Load smaller subset for demonstration
-            dataset = load_dataset("parler-tts/libritts_r_filtered", subset, split="train")
+            dataset = self._load_hf_dataset("parler-tts/libritts_r_filtered", subset)
             
             if max_samples:
                 dataset = dataset.select(range(min(max_samples, len(dataset))))
@@ -200,13 +369,21 @@ class DatasetManager:
             logger.error(f"Failed to load LibriTTS dataset: {e}")
             return None
     
+    def _load_hf_dataset(self, path: str, name: Optional[str] = None) -> "Dataset":
+        """Load a Hugging Face train split, reusing it if already opened."""
+        key = (path, name)
+        if key not in self._hf_datasets:
+            from datasets import load_dataset
+            self._hf_datasets[key] = load_dataset(path, name, split="train")
+        return self._hf_datasets[key]
+    
     def create_custom_dataset(
         self,
         audio_dir: str,
         text_file: str,
         dataset_name: str = "custom",
         audio_format: str = "wav"
-    ) -> Optional[Dataset]:
+    ) -> Optional["Dataset"]:
         """
         Create a dataset from custom audio files and text.
         
@@ -229,38 +406,41 @@ class DatasetManager:
             # Load text mappings
             text_data = self._load_text_mappings(text_file)
             
-            # Prepare dataset items
-            dataset_items = []
-            
-            for audio_file, text in text_data.items():
+            # Find the audio-text pairs; audio is referenced by path and only
+            # decoded when a row is accessed
+            def probe(pair):
+                audio_file, text = pair
                 audio_path = audio_dir / f"{audio_file}.{audio_format}"
                 
-                if audio_path.exists():
-                    try:
-                        # Load audio
-                        audio_data, sample_rate = torchaudio.load(str(audio_path))
-                        
-                        dataset_items.append({
-                            "audio": {
-                                "path": str(audio_path),
-                                "array": audio_data.numpy().squeeze(),
-                                "sampling_rate": sample_rate
-                            },
-                            "text": text,
-                            "id": audio_file
-                        })
-                        
-                    except Exception as e:
-                        logger.warning(f"Failed to load audio {audio_path}: {e}")
-                        continue
-                else:
-                    logger.warning(f"Audio file not found: {audio_path}")
+                if audio_path.is_file():
+                    return str(audio_path), text, audio_file
+                
+                logger.warning(f"Audio file not found: {audio_path}")
+                return None
+            
+            # Existence checks are pure filesystem I/O, so many threads
+            # overlap their latency (notably on network storage)
+            with ThreadPoolExecutor(max_workers=32) as executor:
+                dataset_items = [
+                    item for item in executor.map(probe, text_data.items())
+                    if item is not None
+                ]
             
             if not dataset_items:
                 raise ValueError("No valid audio-text pairs found")
             
-            # Create Hugging Face dataset
-            dataset = Dataset.from_list(dataset_items)
+            import pyarrow as pa
+            from datasets import Audio, Dataset
+            
+            # Create Hugging Face dataset straight from columns of known type,
+            # with a lazily decoded audio column
+            paths, texts, ids = zip(*dataset_items)
+            table = pa.table({
+                "audio": pa.array(paths, type=pa.string()),
+                "text": pa.array(texts, type=pa.string()),
+                "id": pa.array(ids, type=pa.string())
+            })
+            dataset = Dataset(table).cast_column("audio", Audio())
             self.loaded_datasets[dataset_name] = dataset
             
             logger.info(f"Created custom dataset '{dataset_name}' with {len(dataset)} samples")
@@ -286,6 +466,24 @@ class DatasetManager:
     
     def _load_csv_mappings(self, csv_path: Path) -> Dict[str, str]:
         """Load text mappings from CSV file."""
+        # Large files go through pyarrow's multithreaded C++ reader
+        if csv_path.stat().st_size >= CSV_ARROW_MIN_BYTES:
+            import pyarrow as pa
+            import pyarrow.csv as pacsv
+            
+            try:
+                table = pacsv.read_csv(
+                    csv_path,
+                    read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+                    parse_options=pacsv.ParseOptions(delimiter='|'),
+                    convert_options=pacsv.ConvertOptions(
+                        column_types={"f0": pa.string(), "f1": pa.string()}
+                    )
+                )
+                return dict(zip(table.column(0).to_pylist(), table.column(1).to_pylist()))
+            except (pa.ArrowInvalid, IndexError, KeyError) as e:
+                logger.debug(f"Falling back to the csv module for {csv_path}: {e}")
+        
         mappings = {}
         
         with open(csv_path, 'r', encoding='utf-8') as f:
@@ -301,17 +499,22 @@ class DatasetManager:
     
     def _load_json_mappings(self, json_path: Path) -> Dict[str, str]:
         """Load text mappings from JSON file."""
-        with open(json_path, 'r', encoding='utf-8') as f:
-            mappings = json.load(f)
+        with open(json_path, 'rb') as f:
+            mappings = _json_loads(f.read())
         
         return mappings
     
-    def get_dataset_stats(self, dataset_name: str) -> Optional[Dict[str, Any]]:
+    def get_dataset_stats(
+        self,
+        dataset_name: str,
+        seed: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Get statistics for a loaded dataset.
         
         Args:
             dataset_name: Name of the dataset
+            seed: Seed for the audio sampling, for reproducible estimates
             
         Returns:
             Dictionary with dataset statistics
@@ -322,19 +525,37 @@ class DatasetManager:
         
         dataset = self.loaded_datasets[dataset_name]
         
+        # Reuse statistics computed earlier for the same dataset contents and seed
+        cache_path = self._stats_cache_path(dataset, seed)
+        if cache_path is not None and cache_path.exists():
+            try:
+                with open(cache_path, 'rb') as f:
+                    stats = _json_loads(f.read())
+                stats["name"] = dataset_name
+                return stats
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable stats cache {cache_path}: {e}")
+        
         try:
+            # Column names come from the schema, without decoding a row
+            columns = dataset.column_names if hasattr(dataset, 'column_names') else []
+            
             # Basic stats
             stats = {
                 "name": dataset_name,
                 "total_samples": len(dataset),
-                "columns": dataset.column_names if hasattr(dataset, 'column_names') else [],
+                "columns": columns,
             }
             
             # Text statistics
-            if "text" in dataset[0]:
-                texts = [item["text"] for item in dataset]
-                word_counts = [len(text.split()) for text in texts]
-                char_counts = [len(text) for text in texts]
+            if "text" in columns:
+                import pyarrow.compute as pc
+                
+                # Count with Arrow compute kernels over the column buffers
+                # instead of materializing every row as Python objects
+                texts = dataset.with_format("arrow")["text"]
+                word_counts = np.asarray(pc.count_substring_regex(texts, r"\S+"))
+                char_counts = np.asarray(pc.utf8_length(texts))
                 
                 stats["text_stats"] = {
                     "avg_words": np.mean(word_counts),
@@ -346,39 +567,116 @@ class DatasetManager:
                 }
             
             # Audio statistics (sample a few items)
-            if "audio" in dataset[0]:
-                sample_indices = np.random.choice(
-                    len(dataset), 
-                    min(100, len(dataset)), 
-                    replace=False
-                )
-                
+            if "audio" in columns:
+                rng = np.random.default_rng(seed) if seed is not None else _RNG
                 durations = []
                 sample_rates = []
+                total_duration = 0.0
                 
-                for idx in sample_indices:
-                    audio_info = dataset[int(idx)]["audio"]
-                    if isinstance(audio_info, dict):
-                        if "array" in audio_info and "sampling_rate" in audio_info:
-                            duration = len(audio_info["array"]) / audio_info["sampling_rate"]
-                            durations.append(duration)
-                            sample_rates.append(audio_info["sampling_rate"])
+                # Sample every contiguous block of rows in proportion to its
+                # size, and scale each block's mean duration by its row count
+                for stratum_size, indices in _stratified_sample(
+                    len(dataset), min(100, len(dataset)), STATS_STRATA, rng
+                ):
+                    stratum_durations, stratum_rates = self._sample_audio_durations(
+                        dataset, indices.tolist()
+                    )
+                    if stratum_durations:
+                        total_duration += np.mean(stratum_durations) * stratum_size
+                        durations.extend(stratum_durations)
+                        sample_rates.extend(stratum_rates)
                 
                 if durations:
+                    # Bootstrap the sampled durations for a 95% interval
+                    resampled = rng.choice(durations, (1000, len(durations)))
+                    ci_low, ci_high = np.percentile(resampled.mean(axis=1), [2.5, 97.5]) * len(dataset)
+                    
                     stats["audio_stats"] = {
                         "avg_duration": np.mean(durations),
                         "min_duration": np.min(durations),
                         "max_duration": np.max(durations),
-                        "total_duration": np.sum(durations) * len(dataset) / len(sample_indices),
+                        "total_duration": total_duration,
+                        "total_duration_ci95": [ci_low, ci_high],
                         "sample_rates": list(set(sample_rates)),
                     }
             
+            if cache_path is not None:
+                self._save_stats_cache(cache_path, stats)
+            
             return stats
             
         except Exception as e:
             logger.error(f"Failed to compute dataset statistics: {e}")
             return None
     
+    def _sample_audio_durations(
+        self,
+        dataset,
+        indices: List[int]
+    ) -> Tuple[List[float], List[int]]:
+        """
+        Measure the duration and sample rate of a sample of audio clips.
+        
+        Audio features are read without decoding, so only each file's header
+        is parsed; other audio columns are decoded row by row.
+        
+        Args:
+            dataset: Dataset with an "audio" column
+            indices: Rows to measure
+            
+        Returns:
+            Tuple of (durations in seconds, sample rates)
+        """
+        from datasets import Audio
+        
+        durations = []
+        sample_rates = []
+        subset = dataset.select(indices)
+        
+        if isinstance(subset.features.get("audio"), Audio):
+            for row in subset.cast_column("audio", Audio(decode=False)):
+                audio_info = row["audio"]
+                source = io.BytesIO(audio_info["bytes"]) if audio_info.get("bytes") else audio_info.get("path")
+                try:
+                    info = sf.info(source)
+                except Exception as e:
+                    logger.debug(f"Could not read audio header: {e}")
+                    continue
+                durations.append(info.frames / info.samplerate)
+                sample_rates.append(info.samplerate)
+            return durations, sample_rates
+        
+        for row in subset:
+            audio_info = row["audio"]
+            if isinstance(audio_info, dict):
+                if "array" in audio_info and "sampling_rate" in audio_info:
+                    duration = len(audio_info["array"]) / audio_info["sampling_rate"]
+                    durations.append(duration)
+                    sample_rates.append(audio_info["sampling_rate"])
+        
+        return durations, sample_rates
+    
+    def _stats_cache_path(self, dataset, seed: Optional[int] = None) -> Optional[Path]:
+        """Return the stats cache file for a dataset and sampling seed, or None if not cacheable."""
+        fingerprint = getattr(dataset, "_fingerprint", None)
+        if not self.enable_stats_cache or not fingerprint:
+            return None
+        
+        # Seeded estimates are cached apart from unseeded ones and each other
+        name = fingerprint if seed is None else f"{fingerprint}_seed{seed}"
+        return self.data_dir / ".stats_cache" / f"{name}.json"
+    
+    def _save_stats_cache(self, cache_path: Path, stats: Dict[str, Any]):
+        """Atomically write dataset statistics to the stats cache."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".tmp")
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(stats))
+            tmp_path.replace(cache_path)
+        except (OSError, AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Failed to cache dataset statistics: {e}")
+    
     def prepare_training_split(
         self,
         dataset_name: str,
@@ -386,7 +684,7 @@ class DatasetManager:
         val_ratio: float = 0.1,
         test_ratio: float = 0.1,
         seed: int = 42
-    ) -> Optional[DatasetDict]:
+    ) -> Optional["DatasetDict"]:
         """
         Split dataset into train/validation/test sets.
         
@@ -408,36 +706,29 @@ class DatasetManager:
             raise ValueError("Train, validation, and test ratios must sum to 1.0")
         
         try:
+            from datasets import DatasetDict
+            
             dataset = self.loaded_datasets[dataset_name]
             
-            # Split dataset
-            train_val_split = dataset.train_test_split(
-                test_size=(val_ratio + test_ratio),
-                seed=seed
-            )
-            
-            if val_ratio > 0 and test_ratio > 0:
-                val_test_ratio = test_ratio / (val_ratio + test_ratio)
-                val_test_split = train_val_split["test"].train_test_split(
-                    test_size=val_test_ratio,
-                    seed=seed
-                )
-                
-                dataset_dict = DatasetDict({
-                    "train": train_val_split["train"],
-                    "validation": val_test_split["train"],
-                    "test": val_test_split["test"]
-                })
-            elif val_ratio > 0:
-                dataset_dict = DatasetDict({
-                    "train": train_val_split["train"],
-                    "validation": train_val_split["test"]
-                })
-            else:
-                dataset_dict = DatasetDict({
-                    "train": train_val_split["train"],
-                    "test": train_val_split["test"]
-                })
+            # Shuffle the row indices once and slice them into the splits
+            num_rows = len(dataset)
+            num_val = round(num_rows * val_ratio)
+            num_test = round(num_rows * test_ratio)
+            num_train = num_rows - num_val - num_test
+            
+            permutation = np.random.default_rng(seed).permutation(num_rows)
+            splits = {
+                "train": permutation[:num_train],
+                "validation": permutation[num_train:num_train + num_val],
+                "test": permutation[num_train + num_val:]
+            }
+            ratios = {"train": train_ratio, "validation": val_ratio, "test": test_ratio}
+            
+            dataset_dict = DatasetDict({
+                split_name: dataset.select(indices)
+                for split_name, indices in splits.items()
+                if ratios[split_name] > 0
+            })
             
             logger.info(f"Dataset split created:")
             for split_name, split_data in dataset_dict.items():
@@ -449,13 +740,21 @@ class DatasetManager:
             logger.error(f"Failed to split dataset: {e}")
             return None
     
-    def save_dataset(self, dataset_name: str, output_path: str) -> bool:
+    def save_dataset(
+        self,
+        dataset_name: str,
+        output_path: str,
+        format: str = "arrow"
+    ) -> bool:
         """
         Save a loaded dataset to disk.
         
         Args:
             dataset_name: Name of the dataset to save
             output_path: Output directory path
+            format: 'arrow' for save_to_disk, or 'parquet' for independent
+                Parquet shards that can be read in parallel or streamed
+                from object storage
             
         Returns:
             True if successful, False otherwise
@@ -464,12 +763,22 @@ class DatasetManager:
             logger.error(f"Dataset '{dataset_name}' not loaded")
             return False
         
+        if format not in ("arrow", "parquet"):
+            raise ValueError(f"Unsupported dataset format: {format}")
+        
         try:
             dataset = self.loaded_datasets[dataset_name]
             output_path = Path(output_path)
             output_path.mkdir(parents=True, exist_ok=True)
             
-            dataset.save_to_disk(str(output_path))
+            if format == "parquet":
+                num_shards = max(1, math.ceil(dataset.data.nbytes / PARQUET_SHARD_BYTES))
+                for i in range(num_shards):
+                    shard = dataset.shard(num_shards, i, contiguous=True)
+                    shard.to_parquet(str(output_path / f"shard-{i:05d}.parquet"))
+            else:
+                dataset.save_to_disk(str(output_path))
+            
             logger.info(f"Dataset '{dataset_name}' saved to {output_path}")
             return True
             
@@ -482,14 +791,20 @@ class DatasetManager:
         Load a previously saved dataset from disk.
         
         Args:
-            dataset_path: Path to saved dataset
+            dataset_path: Path to saved dataset (either format of save_dataset)
             dataset_name: Name to assign to loaded dataset
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            dataset = Dataset.load_from_disk(dataset_path)
+            from datasets import Dataset
+            
+            shards = sorted(Path(dataset_path).glob("shard-*.parquet"))
+            if shards:
+                dataset = Dataset.from_parquet([str(shard) for shard in shards])
+            else:
+                dataset = Dataset.load_from_disk(dataset_path)
             self.loaded_datasets[dataset_name] = dataset
             logger.info(f"Loaded dataset '{dataset_name}' from {dataset_path}")
             return True
@@ -498,7 +813,6 @@ class DatasetManager:
             logger.error(f"Failed to load dataset from {dataset_path}: {e}")
             return False
 
-
 def main():
     """Example usage of the DatasetManager."""
     print("TTS Dataset Manager Demo")
@@ -7,10 +7,18 @@ and audio output to provide a complete text-to-speech solution.
 
 import os
 import sys
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union
+from typing import IO, Callable, Iterator, List, Optional, Dict, Any, Tuple, Union
 import logging
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
+from functools import cached_property, lru_cache
+
+import numpy as np
+import soundfile as sf
 
 # Add src directory to path
 sys.path.append(str(Path(__file__).parent))
@@ -23,6 +31,28 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _get_text_processor(model_name: str) -> TextProcessor:
+    """Return a shared TextProcessor per model, loading its tokenizer once."""
+    return TextProcessor(model_name)
+
+
+@dataclass
+class TTSConfig:
+    """Processing configuration for the text-to-audio converter."""
+    
+    max_text_length: int = 500
+    audio_format: str = "wav"
+    normalize_audio: bool = True
+    apply_fade: bool = True
+    noise_reduction: bool = False
+    concatenate_segments: bool = True
+    segment_gap_ms: int = 500
+    max_concurrent: int = 3
+    synthesis_batch_size: int = 8
+    num_threads: Optional[int] = None  # None splits the CPUs across max_concurrent workers
+
+
 class TextToAudioConverter:
     """
     Complete text-to-audio conversion system.
@@ -35,7 +65,11 @@ class TextToAudioConverter:
         self,
         model_name: str = "microsoft/speecht5_tts",
         output_dir: str = "output",
-        device: Optional[str] = None
+        device: Optional[str] = None,
+        dtype: Optional[str] = None,
+        quantization: Optional[str] = None,
+        compile_model: bool = False,
+        warmup: bool = True
     ):
         """
         Initialize the text-to-audio converter.
@@ -44,26 +78,30 @@ class TextToAudioConverter:
             model_name: Name of the TTS model to use
             output_dir: Directory for output audio files
             device: Device to run models on ('cpu', 'cuda', or None for auto)
+            dtype: Model precision ('float32', 'float16', 'bfloat16', or None for auto)
+            quantization: Weight quantization ('int8' on CPU, or None)
+            compile_model: Compile the model with torch.compile after loading
+            warmup: Run a throwaway synthesis after loading so the first
+                conversion does not pay one-time startup costs
         """
         self.model_name = model_name
         self.output_dir = Path(output_dir)
         self.device = device
+        self.dtype = dtype
+        self.quantization = quantization
+        self.compile_model = compile_model
+        self.warmup = warmup
         
         # Initialize components
         self.text_processor = None
         self.tts_model = None
         self.audio_processor = None
         
+        # Reusable scratch buffer for batch concatenation, one per thread
+        self._scratch = threading.local()
+        
         # Configuration
-        self.config = {
-            "max_text_length": 500,
-            "audio_format": "wav",
-            "normalize_audio": True,
-            "apply_fade": True,
-            "noise_reduction": False,
-            "concatenate_segments": True,
-            "segment_gap_ms": 500
-        }
+        self.config = TTSConfig()
         
         self._initialize_components()
     
@@ -73,11 +111,15 @@ class TextToAudioConverter:
             logger.info("Initializing text-to-audio converter...")
             
             # Initialize text processor
-            self.text_processor = TextProcessor(self.model_name)
+            self.text_processor = _get_text_processor(self.model_name)
             logger.info("Text processor initialized")
             
             # Initialize TTS model
-            self.tts_model = TTSModelManager(self.model_name, self.device)
+            self.tts_model = TTSModelManager(
+                self.model_name, self.device, self.dtype, self.quantization,
+                self.compile_model, warmup=self.warmup
+            )
+            self._apply_num_threads()
             logger.info("TTS model initialized")
             
             # Initialize audio processor
@@ -94,6 +136,7 @@ class TextToAudioConverter:
         self,
         text: str,
         output_filename: Optional[str] = None,
+        reuse_buffer: bool = False,
         **kwargs
     ) -> Optional[str]:
         """
@@ -102,80 +145,33 @@ class TextToAudioConverter:
         Args:
             text: Input text to convert
             output_filename: Custom output filename (optional)
+            reuse_buffer: Concatenate segments into a scratch buffer shared
+                across calls instead of allocating a new array each time
             **kwargs: Additional processing options
             
         Returns:
             Path to generated audio file or None if failed
         """
-        if not text or not text.strip():
-            logger.error("No text provided for conversion")
-            return None
-        
         try:
             logger.info(f"Converting text to audio: '{text[:50]}...'")
             
-            # Validate text
-            if not self.text_processor.validate_text(text):
-                logger.error("Text validation failed")
-                return None
-            
-            # Process text
-            processed_chunks = self.text_processor.preprocess_for_tts(
-                text, 
-                max_length=self.config["max_text_length"]
-            )
-            
+            processed_chunks = self._prepare_chunks(text)
             if not processed_chunks:
-                logger.error("Text processing produced no output")
                 return None
             
-            logger.info(f"Text processed into {len(processed_chunks)} chunks")
-            
             # Generate audio for each chunk
-            audio_segments = []
             sample_rate = self.tts_model.get_sample_rate()
-            
-            for i, chunk in enumerate(processed_chunks):
-                logger.info(f"Synthesizing chunk {i+1}/{len(processed_chunks)}")
-                
-                audio = self.tts_model.synthesize_speech(chunk)
-                
-                if audio is not None:
-                    audio_segments.append(audio)
-                else:
-                    logger.warning(f"Failed to synthesize chunk {i+1}")
+            audio_segments = [
+                audio for audio in self._synthesize_chunks(processed_chunks)
+                if audio is not None
+            ]
             
             if not audio_segments:
                 logger.error("No audio generated from any text chunks")
                 return None
             
-            # Combine audio segments
-            if len(audio_segments) > 1 and self.config["concatenate_segments"]:
-                logger.info("Concatenating audio segments")
-                combined_audio = self.audio_processor.concatenate_audio(
-                    audio_segments,
-                    gap_ms=self.config["segment_gap_ms"],
-                    sample_rate=sample_rate
-                )
-            else:
-                combined_audio = audio_segments[0]
-            
-            # Apply post-processing
-            processed_audio = self._post_process_audio(combined_audio, sample_rate)
-            
-            # Generate output filename
-            if not output_filename:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                word_count = len(text.split())
-                output_filename = f"tts_output_{word_count}words_{timestamp}"
-            
-            # Save audio
-            output_path = self.audio_processor.save_audio(
-                processed_audio,
-                output_filename,
-                sample_rate,
-                format=self.config["audio_format"],
-                normalize=self.config["normalize_audio"]
+            output_path = self._assemble_and_save(
+                audio_segments, text, output_filename, sample_rate, reuse_buffer
             )
             
             logger.info(f"Text-to-audio conversion completed: {output_path}")
@@ -185,20 +181,332 @@ class TextToAudioConverter:
             logger.error(f"Text-to-audio conversion failed: {e}")
             return None
     
-    def _post_process_audio(self, audio_data, sample_rate):
-        """Apply post-processing to audio data."""
-        processed_audio = audio_data.copy()
+    def convert_text_stream(self, text: str) -> Iterator[np.ndarray]:
+        """
+        Synthesize text sentence by sentence, yielding audio as it is produced.
+        
+        Args:
+            text: Input text to convert
+            
+        Yields:
+            Post-processed audio for each sentence
+        """
+        processed_chunks = self._prepare_chunks(text)
+        if not processed_chunks:
+            return
+        
+        sample_rate = self.tts_model.get_sample_rate()
+        
+        for chunk in processed_chunks:
+            for sentence in self.text_processor.segment_sentences(chunk):
+                produced = False
+                
+                # Very long sentences are split further by the model
+                for audio in self.tts_model.stream_speech(sentence):
+                    produced = True
+                    # Each piece is synthesized fresh, so fade it in place
+                    yield self._post_process_audio(audio, sample_rate, copy=False)
+                
+                if not produced:
+                    logger.warning(f"Failed to synthesize sentence: '{sentence[:50]}...'")
+    
+    def play_text_stream(self, text: str, max_queued: int = 4) -> bool:
+        """
+        Play text while it is being synthesized.
+        
+        A background thread synthesizes upcoming sentences while the current
+        one plays, so audio starts after the first sentence instead of after
+        the whole text.
+        
+        Args:
+            text: Input text to speak
+            max_queued: Maximum number of synthesized sentences waiting to play
+            
+        Returns:
+            True if any audio was played
+        """
+        if not self.playback_available:
+            logger.warning("Audio playback not available")
+            return False
+        
+        sample_rate = self.tts_model.get_sample_rate()
+        audio_queue = queue.Queue(maxsize=max_queued)
+        
+        def produce():
+            try:
+                for audio in self.convert_text_stream(text):
+                    audio_queue.put(audio)
+            except Exception as e:
+                logger.error(f"Streaming synthesis failed: {e}")
+            finally:
+                audio_queue.put(None)
+        
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        
+        played = False
+        while (audio := audio_queue.get()) is not None:
+            if self.audio_processor.play_audio(audio, sample_rate, blocking=True):
+                played = True
+        
+        producer.join()
+        return played
+    
+    def convert_texts_batch(
+        self,
+        items: List[Tuple[str, str]],
+        batch_size: int = 8,
+        max_workers: Optional[int] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Optional[str]]:
+        """
+        Convert several texts, synthesizing their chunks in batches.
+        
+        Chunks from all texts are sorted by length before batching so that
+        each model forward pass pads as little as possible. Post-processing
+        and file writes then run concurrently on a thread pool.
+        
+        Args:
+            items: List of (text, output_filename) pairs
+            batch_size: Number of text chunks per model forward pass
+            max_workers: Threads used to post-process and save the audio
+                (None uses the number of CPUs)
+            progress_callback: Called with (chunks synthesized, total chunks)
+                as synthesis proceeds
+            
+        Returns:
+            Output path for each item, None where conversion failed
+        """
+        sample_rate = self.tts_model.get_sample_rate()
+        
+        # Preprocess every text and flatten the chunks
+        item_chunks = []
+        for text, _ in items:
+            try:
+                item_chunks.append(self._prepare_chunks(text) or [])
+            except Exception as e:
+                logger.error(f"Text processing failed: {e}")
+                item_chunks.append([])
+        
+        all_chunks = [chunk for chunks in item_chunks for chunk in chunks]
+        logger.info(f"Synthesizing {len(all_chunks)} chunks for {len(items)} texts in batches of {batch_size}")
+        
+        # Synthesize in length order, then scatter back to the original order
+        order = sorted(range(len(all_chunks)), key=lambda i: len(all_chunks[i]))
+        sorted_audio = self.tts_model.batch_synthesize(
+            [all_chunks[i] for i in order],
+            batch_size=batch_size,
+            progress_callback=progress_callback
+        )
+        all_audio = [None] * len(all_chunks)
+        for i, audio in zip(order, sorted_audio):
+            all_audio[i] = audio
+        
+        def save_item(text, output_filename, audio_segments):
+            if not audio_segments:
+                logger.error(f"No audio generated for {output_filename}")
+                return None
+            
+            try:
+                return self._assemble_and_save(
+                    audio_segments, text, output_filename, sample_rate, reuse_buffer=True
+                )
+            except Exception as e:
+                logger.error(f"Failed to save {output_filename}: {e}")
+                return None
+        
+        futures = []
+        position = 0
+        
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            for (text, output_filename), chunks in zip(items, item_chunks):
+                audio_segments = [
+                    audio for audio in all_audio[position:position + len(chunks)]
+                    if audio is not None
+                ]
+                position += len(chunks)
+                futures.append(pool.submit(save_item, text, output_filename, audio_segments))
+        
+        output_paths = [future.result() for future in futures]
+        
+        logger.info(f"Batch conversion completed: {sum(1 for p in output_paths if p)}/{len(items)} successful")
+        return output_paths
+    
+    def _synthesize_chunks(self, chunks: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Synthesize chunks, returning audio in chunk order.
+        
+        Models that support batching synthesize length-sorted groups of
+        chunks in padded forward passes. Otherwise up to
+        config.max_concurrent chunks are in flight at once, so Python
+        overhead and model dispatch for one chunk overlap with another.
+        """
+        total = len(chunks)
+        
+        if self.tts_model.supports_batching and total > 1:
+            # Sort by length so each batch pads as little as possible
+            order = sorted(range(total), key=lambda i: len(chunks[i]))
+            sorted_audio = self.tts_model.batch_synthesize(
+                [chunks[i] for i in order], batch_size=self.config.synthesis_batch_size
+            )
+            audio_segments = [None] * total
+            for i, audio in zip(order, sorted_audio):
+                audio_segments[i] = audio
+            return audio_segments
+        
+        log_progress = logger.isEnabledFor(logging.INFO)
+        
+        def synthesize(i, chunk):
+            if log_progress:
+                logger.info(f"Synthesizing chunk {i+1}/{total}")
+            audio = self.tts_model.synthesize_speech(chunk)
+            if audio is None:
+                logger.warning(f"Failed to synthesize chunk {i+1}")
+            return audio
+        
+        workers = min(self.config.max_concurrent, total)
+        if workers <= 1:
+            return [synthesize(i, chunk) for i, chunk in enumerate(chunks)]
+        
+        # map yields results in submission order, whatever order they finish in
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(synthesize, range(total), chunks))
+    
+    def _prepare_chunks(self, text: str) -> Optional[List[str]]:
+        """Validate text and split it into chunks ready for synthesis."""
+        if not text or not text.strip():
+            logger.error("No text provided for conversion")
+            return None
+        
+        # Validate text
+        if not self.text_processor.validate_text(text):
+            logger.error("Text validation failed")
+            return None
+        
+        # Process text
+        processed_chunks = self.text_processor.preprocess_for_tts(
+            text, 
+            max_length=self.config.max_text_length
+        )
+        
+        if not processed_chunks:
+            logger.error("Text processing produced no output")
+            return None
+        
+        logger.info(f"Text processed into {len(processed_chunks)} chunks")
+        return processed_chunks
+    
+    def _assemble_and_save(
+        self,
+        audio_segments: List[np.ndarray],
+        text: str,
+        output_filename: Optional[str],
+        sample_rate: int,
+        reuse_buffer: bool = False
+    ) -> str:
+        """Combine synthesized segments, post-process them and save the result."""
+        # Generate output filename
+        if not output_filename:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            word_count = len(text.split())
+            output_filename = f"tts_output_{word_count}words_{timestamp}"
+        
+        # Stream WAV output segment by segment instead of building the full
+        # recording in memory; noise reduction filters across segment
+        # boundaries, so it still needs the concatenated audio
+        if (len(audio_segments) > 1 and self.config.concatenate_segments
+                and self.config.audio_format == "wav" and not self.config.noise_reduction):
+            logger.info("Streaming audio segments to file")
+            fade_ms = 50 if self.config.apply_fade else 0
+            return self.audio_processor.save_segments(
+                audio_segments,
+                output_filename,
+                sample_rate,
+                gap_ms=self.config.segment_gap_ms,
+                normalize=self.config.normalize_audio,
+                fade_in_ms=fade_ms,
+                fade_out_ms=fade_ms
+            )
+        
+        # Combine audio segments
+        if len(audio_segments) > 1 and self.config.concatenate_segments:
+            logger.info("Concatenating audio segments")
+            combined_audio = self.audio_processor.concatenate_audio(
+                audio_segments,
+                gap_ms=self.config.segment_gap_ms,
+                sample_rate=sample_rate,
+                out=self._get_scratch_buffer(audio_segments, sample_rate) if reuse_buffer else None
+            )
+        else:
+            combined_audio = audio_segments[0]
+        
+        # Apply post-processing. The combined audio is either a fresh array,
+        # a chunk synthesized for this call or this thread's scratch buffer,
+        # and it is only needed until it is saved, so every stage works in
+        # place
+        processed_audio = self._post_process_audio(combined_audio, sample_rate, copy=False)
+        
+        # Save audio
+        return self.audio_processor.save_audio(
+            processed_audio,
+            output_filename,
+            sample_rate,
+            format=self.config.audio_format,
+            normalize=self.config.normalize_audio,
+            in_place=True
+        )
+    
+    def _get_scratch_buffer(self, audio_segments, sample_rate):
+        """Return a scratch buffer large enough to concatenate the segments."""
+        gap_samples = int(self.config.segment_gap_ms * sample_rate / 1000)
+        required = sum(len(segment) for segment in audio_segments)
+        required += gap_samples * (len(audio_segments) - 1)
+        
+        # Grow geometrically so a batch settles on a single allocation
+        buffer = getattr(self._scratch, "buffer", None)
+        if buffer is None or len(buffer) < required:
+            current = 0 if buffer is None else len(buffer)
+            buffer = np.empty(max(required, current * 2), dtype=np.float32)
+            self._scratch.buffer = buffer
+        
+        return buffer
+    
+    def _post_process_audio(self, audio_data, sample_rate, copy=True):
+        """
+        Apply post-processing to audio data.
+        
+        Args:
+            audio_data: Audio array to process
+            sample_rate: Audio sample rate
+            copy: Leave audio_data untouched; pass False when the caller
+                owns the array and does not need it afterwards
+            
+        Returns:
+            Processed audio array; audio_data itself when no post-processing
+            is enabled
+        """
+        config = self.config
+        
+        # Nothing to apply: hand the audio back as is
+        if not (config.noise_reduction or config.apply_fade):
+            return audio_data
+        
+        processed_audio = audio_data
         
         # Apply noise reduction if enabled
-        if self.config["noise_reduction"]:
+        if config.noise_reduction:
             processed_audio = self.audio_processor.apply_noise_reduction(
                 processed_audio, sample_rate, strength=0.3
             )
         
+        # Copy once, unless noise reduction already produced a new array
+        if copy and processed_audio is audio_data:
+            processed_audio = audio_data.copy()
+        
         # Apply fade in/out if enabled
-        if self.config["apply_fade"]:
+        if config.apply_fade:
             processed_audio = self.audio_processor.apply_fade(
-                processed_audio, sample_rate=sample_rate
+                processed_audio, sample_rate=sample_rate, in_place=True
             )
         
         return processed_audio
@@ -206,7 +514,8 @@ class TextToAudioConverter:
     def convert_batch(
         self,
         texts: List[str],
-        output_prefix: str = "batch"
+        output_prefix: str = "batch",
+        reuse_buffer: bool = True
     ) -> List[str]:
         """
         Convert multiple texts to audio files.
@@ -214,6 +523,7 @@ class TextToAudioConverter:
         Args:
             texts: List of input texts
             output_prefix: Prefix for output filenames
+            reuse_buffer: Share one concatenation buffer across the batch
             
         Returns:
             List of paths to generated audio files
@@ -223,7 +533,7 @@ class TextToAudioConverter:
         for i, text in enumerate(texts):
             try:
                 filename = f"{output_prefix}_{i+1:03d}"
-                output_path = self.convert_text(text, filename)
+                output_path = self.convert_text(text, filename, reuse_buffer=reuse_buffer)
                 
                 if output_path:
                     output_paths.append(output_path)
@@ -241,7 +551,8 @@ class TextToAudioConverter:
     def convert_questions_and_answers(
         self,
         qa_pairs: List[Dict[str, str]],
-        include_questions: bool = True
+        include_questions: bool = True,
+        reuse_buffer: bool = True
     ) -> List[str]:
         """
         Convert question-answer pairs to audio.
@@ -249,24 +560,36 @@ class TextToAudioConverter:
         Args:
             qa_pairs: List of dicts with 'question' and 'answer' keys
             include_questions: Whether to include questions in audio
+            reuse_buffer: Share one concatenation buffer across all pairs
             
         Returns:
             List of paths to generated audio files
         """
         output_paths = []
         
+        # Paths already produced for identical pairs in this call
+        converted = {}
+        
         for i, qa_pair in enumerate(qa_pairs):
             try:
                 question = qa_pair.get('question', '')
                 answer = qa_pair.get('answer', '')
                 
+                if (question, answer) in converted:
+                    output_path = converted[(question, answer)]
+                    if output_path:
+                        output_paths.append(output_path)
+                        logger.info(f"Q&A pair {i+1}/{len(qa_pairs)} is a duplicate, reusing {output_path}")
+                    continue
+                
                 if include_questions and question:
                     full_text = f"Question: {question}. Answer: {answer}"
                 else:
                     full_text = answer
                 
                 filename = f"qa_{i+1:03d}"
-                output_path = self.convert_text(full_text, filename)
+                output_path = self.convert_text(full_text, filename, reuse_buffer=reuse_buffer)
+                converted[(question, answer)] = output_path
                 
                 if output_path:
                     output_paths.append(output_path)
@@ -278,6 +601,11 @@ class TextToAudioConverter:
         
         return output_paths
     
+    @cached_property
+    def playback_available(self) -> bool:
+        """Whether audio can be played on this machine."""
+        return self.audio_processor.playback_available
+    
     def play_audio_file(self, file_path: str) -> bool:
         """
         Play an audio file.
@@ -288,6 +616,11 @@ class TextToAudioConverter:
         Returns:
             True if playback started successfully
         """
+        # Skip decoding the file when it could never be played
+        if not self.playback_available:
+            logger.warning("Audio playback not available")
+            return False
+        
         try:
             audio_data, sample_rate = self.audio_processor.load_audio(file_path)
             return self.audio_processor.play_audio(audio_data, sample_rate)
@@ -303,7 +636,7 @@ class TextToAudioConverter:
             "model_name": self.model_name,
             "output_dir": str(self.output_dir),
             "device": self.device,
-            "config": self.config.copy(),
+            "config": asdict(self.config),
             "tts_model_info": tts_info,
             "components_initialized": {
                 "text_processor": self.text_processor is not None,
@@ -316,13 +649,23 @@ class TextToAudioConverter:
     
     def update_config(self, **kwargs):
         """Update configuration parameters."""
+        field_names = {field.name for field in fields(self.config)}
         for key, value in kwargs.items():
-            if key in self.config:
-                self.config[key] = value
+            if key in field_names:
+                setattr(self.config, key, value)
+                if key in ("num_threads", "max_concurrent") and self.tts_model:
+                    self._apply_num_threads()
                 logger.info(f"Updated config: {key} = {value}")
             else:
                 logger.warning(f"Unknown config parameter: {key}")
     
+    def _apply_num_threads(self):
+        """Set the inference thread count, splitting the CPUs across workers by default."""
+        num_threads = self.config.num_threads
+        if num_threads is None:
+            num_threads = (os.cpu_count() or 1) // max(1, self.config.max_concurrent)
+        self.tts_model.set_num_threads(num_threads)
+    
     def switch_model(self, model_name: str) -> bool:
         """
         Switch to a different TTS model.
@@ -337,8 +680,8 @@ class TextToAudioConverter:
             success = self.tts_model.switch_model(model_name)
             if success:
                 self.model_name = model_name
-                # Reinitialize text processor with new model
-                self.text_processor = TextProcessor(model_name)
+                # Switch to the new model's text processor (reused if loaded before)
+                self.text_processor = _get_text_processor(model_name)
             return success
         except Exception as e:
             logger.error(f"Failed to switch model: {e}")
@@ -427,13 +770,61 @@ def main():
     # List all generated files
     print(f"\nGenerated files in {converter.output_dir}:")
     if converter.output_dir.exists():
-        for file_path in converter.output_dir.glob("*.wav"):
-            print(f"  - {file_path.name}")
+        with os.scandir(converter.output_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".wav") and entry.is_file():
+                    print(f"  - {entry.name}")
     
     # Cleanup
     converter.cleanup()
     print("\nDemo completed!")
 
 
+def serve_batch(
+    input_stream: IO[str] = sys.stdin,
+    output_stream: IO[str] = sys.stdout,
+    converter: Optional[TextToAudioConverter] = None
+):
+    """
+    Convert requests read line by line, keeping one model loaded throughout.
+    
+    Each input line is "<output_filename>\t<text>". For every line, one
+    response line is written and flushed: "OK\t<path>\t<duration>" with
+    the duration in seconds, or "ERR\t<output_filename>\t<reason>".
+    Blank lines are ignored. Logs go to stderr, so the output stream
+    carries only responses.
+    
+    Args:
+        input_stream: Stream of request lines
+        output_stream: Stream receiving response lines
+        converter: Converter to use (a default one is created if None)
+    """
+    converter = converter or TextToAudioConverter()
+    
+    try:
+        for line in input_stream:
+            line = line.rstrip("\n")
+            if not line.strip():
+                continue
+            
+            output_filename, sep, text = line.partition("\t")
+            if not sep or not text.strip():
+                response = f"ERR\t{output_filename}\texpected a tab between filename and text"
+            else:
+                audio_path = converter.convert_text(text, Path(output_filename).stem)
+                if audio_path:
+                    response = f"OK\t{audio_path}\t{sf.info(audio_path).duration:.3f}"
+                else:
+                    response = f"ERR\t{output_filename}\tconversion failed"
+            
+            output_stream.write(response + "\n")
+            output_stream.flush()
+    finally:
+        converter.cleanup()
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--batch" in sys.argv[1:]:
+        serve_batch()
+    else:
+        main()
\ No newline at end of file
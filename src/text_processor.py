@@ -7,25 +7,93 @@ utilities for preparing text input for text-to-speech models.
 
 import re
 import string
-import nltk
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from transformers import AutoTokenizer
 import logging
 
-# Download required NLTK data
-try:
-    nltk.data.find('tokenizers/punkt')
-except LookupError:
-    nltk.download('punkt')
-
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
-
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Text normalization patterns
+ABBREVIATIONS = {
+    "dr.": "doctor",
+    "mr.": "mister", 
+    "mrs.": "misses",
+    "ms.": "miss",
+    "prof.": "professor",
+    "st.": "street",
+    "ave.": "avenue",
+    "blvd.": "boulevard",
+    "etc.": "etcetera",
+    "vs.": "versus",
+    "e.g.": "for example",
+    "i.e.": "that is",
+}
+
+# Number to word mapping for basic numbers
+NUMBERS = {
+    "0": "zero", "1": "one", "2": "two", "3": "three", "4": "four",
+    "5": "five", "6": "six", "7": "seven", "8": "eight", "9": "nine",
+    "10": "ten", "11": "eleven", "12": "twelve", "13": "thirteen",
+    "14": "fourteen", "15": "fifteen", "16": "sixteen", "17": "seventeen",
+    "18": "eighteen", "19": "nineteen", "20": "twenty"
+}
+
+# Common symbols spoken as words
+SYMBOL_REPLACEMENTS = {
+    '&': ' and ',
+    '@': ' at ',
+    '#': ' hash ',
+    '$': ' dollar ',
+    '%': ' percent ',
+    '+': ' plus ',
+    '=': ' equals ',
+    '<': ' less than ',
+    '>': ' greater than ',
+    '|': ' or ',
+}
+
+# Compiled once so cleaning runs each substitution as a single C-level pass;
+# abbreviations are alternated longest first so the longest match wins
+_WHITESPACE_RE = re.compile(r'\s+')
+_SPECIAL_CHARS_RE = re.compile(r'[^\w\s\.,!?\-\']')
+_ABBREVIATION_RE = re.compile(
+    '|'.join(re.escape(abbr) for abbr in sorted(ABBREVIATIONS, key=len, reverse=True))
+)
+_SYMBOL_TABLE = str.maketrans(SYMBOL_REPLACEMENTS)
+
+# A whitespace-delimited word made of digits, optionally wrapped in punctuation
+_PUNCT = '[' + re.escape(string.punctuation) + ']*'
+_NUMBER_WORD_RE = re.compile(r'(?<!\S)(' + _PUNCT + r')([0-9]+)(?=' + _PUNCT + r'(?!\S))')
+
+# Sentences end at whitespace after terminal punctuation. Segmentation runs
+# on cleaned text, where abbreviations are already expanded and everything
+# is lowercase, so a period followed by a space ends a sentence
+_SENTENCE_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Texts longer than this are segmented with NLTK's Punkt tokenizer instead
+NLTK_MIN_CHARS = 10_000
+
+
+def _expand_number(match: re.Match) -> str:
+    """Spell out a matched number word if it is in the number mapping."""
+    number = match.group(2)
+    return match.group(1) + NUMBERS.get(number, number)
+
+
+@lru_cache(maxsize=1)
+def _load_nltk():
+    """Import NLTK and download the Punkt model on first use."""
+    import nltk
+    
+    try:
+        nltk.data.find('tokenizers/punkt')
+    except LookupError:
+        nltk.download('punkt')
+    
+    return nltk
+
 
 class TextProcessor:
     """
@@ -51,34 +119,16 @@ class TextProcessor:
         self._load_tokenizer()
         
         # Define text normalization patterns
-        self.abbreviations = {
-            "dr.": "doctor",
-            "mr.": "mister", 
-            "mrs.": "misses",
-            "ms.": "miss",
-            "prof.": "professor",
-            "st.": "street",
-            "ave.": "avenue",
-            "blvd.": "boulevard",
-            "etc.": "etcetera",
-            "vs.": "versus",
-            "e.g.": "for example",
-            "i.e.": "that is",
-        }
+        self.abbreviations = ABBREVIATIONS
         
         # Number to word mapping for basic numbers
-        self.numbers = {
-            "0": "zero", "1": "one", "2": "two", "3": "three", "4": "four",
-            "5": "five", "6": "six", "7": "seven", "8": "eight", "9": "nine",
-            "10": "ten", "11": "eleven", "12": "twelve", "13": "thirteen",
-            "14": "fourteen", "15": "fifteen", "16": "sixteen", "17": "seventeen",
-            "18": "eighteen", "19": "nineteen", "20": "twenty"
-        }
+        self.numbers = NUMBERS
     
     def _load_tokenizer(self):
         """Load the tokenizer for the specified model."""
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            # Prefer the Rust-backed fast tokenizer when the model has one
+            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, use_fast=True)
             logger.info(f"Loaded tokenizer for {self.model_name}")
         except Exception as e:
             logger.warning(f"Could not load tokenizer for {self.model_name}: {e}")
@@ -101,58 +151,29 @@ class TextProcessor:
         text = text.lower()
         
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = _WHITESPACE_RE.sub(' ', text)
         
         # Expand abbreviations
-        for abbr, expansion in self.abbreviations.items():
-            text = text.replace(abbr, expansion)
-        
-        # Handle basic number expansion
-        words = text.split()
-        expanded_words = []
-        
-        for word in words:
-            # Remove punctuation for checking
-            clean_word = word.strip(string.punctuation)
-            if clean_word in self.numbers:
-                # Preserve surrounding punctuation
-                prefix = word[:len(word) - len(word.lstrip(string.punctuation))]
-                suffix = word[len(word.rstrip(string.punctuation)):]
-                expanded_words.append(prefix + self.numbers[clean_word] + suffix)
-            else:
-                expanded_words.append(word)
+        text = _ABBREVIATION_RE.sub(lambda match: ABBREVIATIONS[match.group(0)], text)
         
-        text = ' '.join(expanded_words)
+        # Handle basic number expansion, preserving surrounding punctuation
+        text = _NUMBER_WORD_RE.sub(_expand_number, text)
         
         # Handle special characters
         text = self._handle_special_characters(text)
         
         # Final cleanup
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = _WHITESPACE_RE.sub(' ', text).strip()
         
         return text
     
     def _handle_special_characters(self, text: str) -> str:
         """Handle special characters and symbols."""
-        # Replace common symbols with words
-        replacements = {
-            '&': ' and ',
-            '@': ' at ',
-            '#': ' hash ',
-            '$': ' dollar ',
-            '%': ' percent ',
-            '+': ' plus ',
-            '=': ' equals ',
-            '<': ' less than ',
-            '>': ' greater than ',
-            '|': ' or ',
-        }
-        
-        for symbol, replacement in replacements.items():
-            text = text.replace(symbol, replacement)
+        # Replace common symbols with words in one pass
+        text = text.translate(_SYMBOL_TABLE)
         
         # Remove remaining special characters that might cause issues
-        text = re.sub(r'[^\w\s\.,!?\-\']', ' ', text)
+        text = _SPECIAL_CHARS_RE.sub(' ', text)
         
         return text
     
@@ -166,14 +187,16 @@ class TextProcessor:
         Returns:
             List of sentences
         """
-        try:
-            sentences = nltk.sent_tokenize(text)
-            return [s.strip() for s in sentences if s.strip()]
-        except Exception as e:
-            logger.warning(f"NLTK sentence tokenization failed: {e}")
-            # Fallback to simple sentence splitting
-            sentences = re.split(r'[.!?]+', text)
-            return [s.strip() for s in sentences if s.strip()]
+        if len(text) > NLTK_MIN_CHARS:
+            try:
+                sentences = _load_nltk().sent_tokenize(text)
+                return [s.strip() for s in sentences if s.strip()]
+            except Exception as e:
+                logger.warning(f"NLTK sentence tokenization failed: {e}")
+        
+        # Split at sentence boundaries in a single regex pass
+        sentences = _SENTENCE_BOUNDARY_RE.split(text)
+        return [s.strip() for s in sentences if s.strip()]
     
     def tokenize_text(self, text: str) -> Optional[Dict[str, Any]]:
         """
@@ -219,20 +242,24 @@ class TextProcessor:
         # Segment into sentences
         sentences = self.segment_sentences(cleaned_text)
         
-        # Group sentences into chunks that don't exceed max_length
+        # Group sentences into chunks that don't exceed max_length, tracking
+        # the joined length so each chunk is built with a single join
         chunks = []
-        current_chunk = ""
+        current_chunk = []
+        current_length = 0
         
         for sentence in sentences:
-            if len(current_chunk + " " + sentence) <= max_length:
-                current_chunk = (current_chunk + " " + sentence).strip()
+            if current_length + 1 + len(sentence) <= max_length:
+                current_length += len(sentence) + (1 if current_chunk else 0)
+                current_chunk.append(sentence)
             else:
                 if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = sentence
+                    chunks.append(" ".join(current_chunk))
+                current_chunk = [sentence]
+                current_length = len(sentence)
         
         if current_chunk:
-            chunks.append(current_chunk)
+            chunks.append(" ".join(current_chunk))
         
         return chunks
     
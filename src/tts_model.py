@@ -7,10 +7,11 @@ for converting text to high-quality speech audio.
 
 import torch
 import numpy as np
-from typing import Optional, Union, List, Dict, Any
+from typing import Callable, Iterator, Optional, Union, List, Dict, Any
 from transformers import (
     SpeechT5Processor, 
     SpeechT5ForTextToSpeech,
+    SpeechT5HifiGan,
     VitsModel,
     VitsTokenizer
 )
@@ -18,6 +19,11 @@ from datasets import load_dataset
 import logging
 import warnings
 import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 
 # Suppress some warnings for cleaner output
 warnings.filterwarnings("ignore", category=FutureWarning)
@@ -26,6 +32,93 @@ warnings.filterwarnings("ignore", category=UserWarning)
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of distinct texts whose token ids are kept per model
+TOKEN_CACHE_SIZE = 512
+
+# Output projections kept in full precision under int8 quantization, since
+# their errors go straight into the spectrogram and stop decision
+QUANTIZE_EXCLUDE = (
+    "speech_decoder_postnet.feat_out",
+    "speech_decoder_postnet.prob_out",
+)
+
+# int8 kernels only pay off for inputs that fill whole vector blocks
+QUANTIZE_MIN_ALIGNMENT = 64
+
+# SpeechT5 inputs longer than this are synthesized sentence by sentence
+SPEECHT5_SPLIT_CHARS = 200
+
+# Silence inserted between the sentences of a long SpeechT5 input
+SENTENCE_PAUSE_SECONDS = 0.3
+
+# Sentence terminators a long SpeechT5 input is split at
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+# Pretrained models, vocoders and processors shared by every manager in the
+# process, keyed by class, name and (for modules) device and precision
+_PRETRAINED_CACHE: Dict[tuple, Any] = {}
+_PRETRAINED_LOCK = threading.Lock()
+
+
+def _load_pretrained(cls, name: str, device: Optional[str] = None, dtype: Optional[torch.dtype] = None):
+    """
+    Load a pretrained model or processor once per process and share it.
+    
+    Modules are moved to the device and precision and put in eval mode.
+    CPU modules are also placed in shared memory (Module.share_memory), so
+    worker processes map the same weights. Callers must not modify a
+    shared module in place.
+    
+    Args:
+        cls: Hugging Face class providing from_pretrained
+        name: Model name or path
+        device: Device for modules (None for processors and tokenizers)
+        dtype: Precision for modules
+        
+    Returns:
+        The shared instance
+    """
+    key = (cls.__name__, name, device, dtype)
+    
+    with _PRETRAINED_LOCK:
+        instance = _PRETRAINED_CACHE.get(key)
+        if instance is None:
+            instance = cls.from_pretrained(name)
+            if device is not None:
+                instance.to(device, dtype=dtype)
+                instance.eval()
+                if torch.device(device).type == "cpu":
+                    instance.share_memory()
+            _PRETRAINED_CACHE[key] = instance
+        else:
+            logger.info(f"Reusing loaded {cls.__name__} for {name}")
+    
+    return instance
+
+
+def clear_pretrained_cache():
+    """Drop every shared model so its memory can be freed once managers release it."""
+    with _PRETRAINED_LOCK:
+        _PRETRAINED_CACHE.clear()
+
+
+@lru_cache(maxsize=1)
+def _default_xvector() -> List[float]:
+    """Load the default SpeechT5 speaker x-vector from CMU Arctic once."""
+    embeddings_dataset = load_dataset("Matthijs/cmu-arctic-xvectors", split="validation")
+    return embeddings_dataset[7306]["xvector"]
+
+
+@lru_cache(maxsize=16)
+def _edge_fade(length: int):
+    """Return read-only float32 (fade_in, fade_out) ramps of the given length."""
+    fade_in = np.linspace(0, 1, length, dtype=np.float32)
+    fade_out = np.linspace(1, 0, length, dtype=np.float32)
+    fade_in.setflags(write=False)
+    fade_out.setflags(write=False)
+    return fade_in, fade_out
+
 
 class TTSModelManager:
     """
@@ -37,22 +130,52 @@ class TTSModelManager:
     - VITS models
     """
     
-    def __init__(self, model_name: str = "microsoft/speecht5_tts", device: Optional[str] = None):
+    def __init__(
+        self,
+        model_name: str = "microsoft/speecht5_tts",
+        device: Optional[str] = None,
+        dtype: Optional[str] = None,
+        quantization: Optional[str] = None,
+        compile_model: bool = False,
+        warmup: bool = True
+    ):
         """
         Initialize the TTS model manager.
         
         Args:
             model_name: Name of the TTS model to use
             device: Device to run the model on ('cpu', 'cuda', or None for auto-detection)
+            dtype: Weight precision ('float32', 'float16', 'bfloat16', or None for auto-detection)
+            quantization: Weight quantization ('int8' for dynamic int8 linear
+                layers on CPU, or None)
+            compile_model: Compile the model's forward passes with
+                torch.compile after loading
+            warmup: Run a throwaway synthesis after each model load so the
+                first request does not pay one-time startup costs
         """
         self.model_name = model_name
         self.device = device or self._get_device()
+        if self.device == "cpu":
+            self._configure_cpu_backend()
+        self.dtype = self._get_dtype(dtype)
+        self.quantization = quantization
+        
+        # int8 dynamic quantization works from float32 weights; load them
+        # that way rather than converting the shared model afterwards
+        if quantization == "int8" and self.device.startswith("cpu") and self.dtype != torch.float32:
+            logger.info("Loading float32 weights for int8 quantization")
+            self.dtype = torch.float32
+        self.compile_model = compile_model
+        self.warmup_on_load = warmup
         self.model = None
         self.processor = None
         self.tokenizer = None
         self.vocoder = None
         self.speaker_embeddings = None
         
+        # Repeated texts (templated batches, Q&A prompts) skip tokenization
+        self._cached_input_ids = lru_cache(maxsize=TOKEN_CACHE_SIZE)(self._input_ids)
+        
         # Model configuration
         self.model_configs = {
             "microsoft/speecht5_tts": {
@@ -84,6 +207,46 @@ class TTSModelManager:
             logger.info("Using CPU for inference")
         return device
     
+    def _get_dtype(self, dtype: Optional[str]) -> torch.dtype:
+        """Resolve the requested precision, picking the fastest safe one by default."""
+        if dtype and dtype != "auto":
+            return getattr(torch, dtype)
+        
+        if self.device.startswith("cuda") and torch.cuda.is_available():
+            # bfloat16 on Ampere and newer, float16 on older GPUs
+            resolved = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        elif self.device == "cpu" and self._cpu_has_native_bf16():
+            # AVX512-BF16 / AMX CPUs run bfloat16 matmuls natively
+            resolved = torch.bfloat16
+        else:
+            resolved = torch.float32
+        
+        logger.info(f"Using {resolved} precision")
+        return resolved
+    
+    @staticmethod
+    def _configure_cpu_backend():
+        """Use oneDNN kernels and a single inter-op thread for CPU inference."""
+        torch.backends.mkldnn.enabled = True
+        
+        # Synthesis runs one operator at a time, so a second thread pool
+        # only competes with the intra-op threads; PyTorch refuses the
+        # change once parallel work has started
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            pass
+    
+    @staticmethod
+    def _cpu_has_native_bf16() -> bool:
+        """Whether the CPU has bfloat16 instructions rather than emulating them."""
+        # Probes only exist in newer PyTorch builds; assume no support otherwise
+        probes = ("_is_avx512_bf16_supported", "_is_amx_tile_supported")
+        try:
+            return any(getattr(torch.cpu, probe, lambda: False)() for probe in probes)
+        except Exception:
+            return False
+    
     def _load_model(self):
         """Load the specified TTS model and processor."""
         try:
@@ -96,7 +259,10 @@ class TTSModelManager:
             else:
                 # Try to load as SpeechT5 by default
                 self._load_speecht5_model()
-                
+            
+            self._ensure_on_device()
+            self._quantize_model()
+            self._compile_model()
             logger.info(f"Successfully loaded {self.model_name}")
             
         except Exception as e:
@@ -104,41 +270,135 @@ class TTSModelManager:
             logger.info("Falling back to default model...")
             self.model_name = "microsoft/speecht5_tts"
             self._load_speecht5_model()
+            self._ensure_on_device()
+            self._quantize_model()
+            self._compile_model()
+        
+        if self.warmup_on_load:
+            self.warmup()
+    
+    def _ensure_on_device(self):
+        """Put the model and vocoder in eval mode and check every weight is on the target device."""
+        target = torch.device(self.device)
+        
+        for module in (self.model, self.vocoder):
+            if module is None:
+                continue
+            
+            module.eval()
+            
+            # A stray CPU submodule makes every GPU forward pass copy weights
+            misplaced = [
+                name for name, tensor in chain(module.named_parameters(), module.named_buffers())
+                if tensor.device.type != target.type
+                or (target.index is not None and tensor.device.index != target.index)
+            ]
+            
+            if misplaced:
+                logger.warning(
+                    f"{len(misplaced)} {type(module).__name__} tensors were not on {self.device} "
+                    f"(e.g. {misplaced[0]}); moving them"
+                )
+                module.to(target)
+    
+    def _quantize_model(self):
+        """Replace the model's linear layers with dynamically quantized int8 ones."""
+        if not self.quantization:
+            return
+        
+        if self.quantization != "int8":
+            logger.warning(f"Unsupported quantization '{self.quantization}'; keeping {self.dtype} weights")
+            self.quantization = None
+            return
+        
+        # Dynamic quantization kernels only exist for CPU
+        if not self.device.startswith("cpu"):
+            logger.warning(f"int8 quantization is only supported on CPU; keeping {self.dtype} weights on {self.device}")
+            self.quantization = None
+            return
+        
+        # Select layers by name, skipping the excluded output projections
+        # and shapes where int8 matmuls tend to be slower than float
+        layers = {
+            name: module for name, module in self.model.named_modules()
+            if isinstance(module, torch.nn.Linear)
+            and name not in QUANTIZE_EXCLUDE
+            and module.in_features % QUANTIZE_MIN_ALIGNMENT == 0
+        }
+        float_bytes = sum(m.weight.numel() * m.weight.element_size() for m in layers.values())
+        int8_bytes = sum(m.weight.numel() for m in layers.values())
+        
+        # quantize_dynamic works on a copy, leaving the shared float model
+        # intact for other managers
+        self.model = torch.ao.quantization.quantize_dynamic(
+            self.model,
+            {name: torch.ao.quantization.default_dynamic_qconfig for name in layers},
+            dtype=torch.qint8
+        )
+        logger.info(
+            f"Quantized {len(layers)} linear layers to int8 "
+            f"({float_bytes / 2**20:.1f} MB -> {int8_bytes / 2**20:.1f} MB of weights)"
+        )
+    
+    def _compile_model(self):
+        """Compile the forward passes used during synthesis with torch.compile."""
+        if not self.compile_model:
+            return
+        
+        try:
+            # Text lengths vary per call, so compile for dynamic shapes
+            # rather than recompiling (or capturing CUDA graphs) per length
+            if self.vocoder is not None:
+                # generate_speech runs its decoding loop in Python and is not
+                # a forward pass; the vocoder call inside it is
+                self.vocoder = torch.compile(self.vocoder, dynamic=True)
+            else:
+                self.model = torch.compile(self.model, dynamic=True)
+            logger.info("Compiled model with torch.compile")
+        except Exception as e:
+            logger.warning(f"torch.compile failed, running eagerly: {e}")
     
     def _load_speecht5_model(self):
         """Load Microsoft SpeechT5 TTS model."""
-        self.processor = SpeechT5Processor.from_pretrained(self.model_name)
-        self.model = SpeechT5ForTextToSpeech.from_pretrained(self.model_name)
-        self.model.to(self.device)
+        self.processor = _load_pretrained(SpeechT5Processor, self.model_name)
+        self.model = _load_pretrained(SpeechT5ForTextToSpeech, self.model_name, self.device, self.dtype)
+        
+        # SpeechT5 predicts mel spectrograms; HiFi-GAN turns them into audio
+        self.vocoder = _load_pretrained(SpeechT5HifiGan, "microsoft/speecht5_hifigan", self.device, self.dtype)
         
         # Load default speaker embeddings
         self._load_speaker_embeddings()
     
     def _load_vits_model(self):
         """Load VITS-based TTS model."""
-        self.model = VitsModel.from_pretrained(self.model_name)
-        self.tokenizer = VitsTokenizer.from_pretrained(self.model_name)
-        self.model.to(self.device)
+        self.model = _load_pretrained(VitsModel, self.model_name, self.device, self.dtype)
+        self.tokenizer = _load_pretrained(VitsTokenizer, self.model_name)
     
     def _load_speaker_embeddings(self):
         """Load speaker embeddings for models that require them."""
         try:
             # Load speaker embeddings from CMU Arctic dataset
-            embeddings_dataset = load_dataset("Matthijs/cmu-arctic-xvectors", split="validation")
-            self.speaker_embeddings = torch.tensor(embeddings_dataset[7306]["xvector"]).unsqueeze(0)
+            speaker_embeddings = torch.as_tensor(
+                _default_xvector(), dtype=self.dtype, device=self.device
+            )
             logger.info("Loaded default speaker embeddings")
         except Exception as e:
             logger.warning(f"Could not load speaker embeddings: {e}")
             # Create dummy speaker embeddings as fallback
-            self.speaker_embeddings = torch.randn(1, 512)
+            speaker_embeddings = torch.randn(512, dtype=self.dtype, device=self.device)
+        
+        # Built directly on the device in the model's precision and kept as
+        # a single (1, dim) embedding, so synthesis reuses it as is
+        self.speaker_embeddings = speaker_embeddings.reshape(1, -1)
     
     def synthesize_speech(
         self, 
         text: str, 
         speaker_id: Optional[int] = None,
         speed: float = 1.0,
-        pitch: float = 1.0
-    ) -> Optional[np.ndarray]:
+        pitch: float = 1.0,
+        return_tensor: bool = False
+    ) -> Optional[Union[np.ndarray, torch.Tensor]]:
         """
         Convert text to speech audio.
         
@@ -147,9 +407,13 @@ class TTSModelManager:
             speaker_id: Speaker ID for multi-speaker models
             speed: Speech speed multiplier (1.0 = normal)
             pitch: Pitch multiplier (1.0 = normal)
+            return_tensor: Return a float32 torch tensor instead of a numpy
+                array. Audio from a single forward pass stays on the model's
+                device, skipping the device-to-host copy; sentence-joined
+                audio is a CPU tensor sharing the numpy buffer
             
         Returns:
-            Audio array or None if synthesis failed
+            Audio array (or tensor) or None if synthesis failed
         """
         if not self.model:
             logger.error("No model loaded")
@@ -161,98 +425,268 @@ class TTSModelManager:
         
         try:
             if self.model_name.startswith("microsoft/speecht5"):
-                return self._synthesize_speecht5(text, speaker_id)
+                return self._synthesize_speecht5(text, speaker_id, return_tensor)
             elif "mms-tts" in self.model_name or "vits" in self.model_name.lower():
-                return self._synthesize_vits(text)
+                return self._synthesize_vits(text, return_tensor)
             else:
-                return self._synthesize_speecht5(text, speaker_id)
+                return self._synthesize_speecht5(text, speaker_id, return_tensor)
                 
         except Exception as e:
             logger.error(f"Speech synthesis failed: {e}")
             return None
     
-    def _synthesize_speecht5(self, text: str, speaker_id: Optional[int] = None) -> Optional[np.ndarray]:
+    def _synthesize_speecht5(
+        self,
+        text: str,
+        speaker_id: Optional[int] = None,
+        return_tensor: bool = False
+    ) -> Optional[Union[np.ndarray, torch.Tensor]]:
         """Synthesize speech using SpeechT5 model."""
         try:
             # Process text in smaller chunks for better quality
-            if len(text) > 200:
+            if len(text) > SPEECHT5_SPLIT_CHARS:
                 # Split into sentences for better audio quality
-                sentences = text.replace('!', '.').replace('?', '.').split('.')
-                sentences = [s.strip() for s in sentences if s.strip()]
+                sentences = self._split_sentences(text)
                 
-                audio_chunks = []
-                for sentence in sentences:
-                    if len(sentence) > 5:  # Skip very short segments
-                        chunk_audio = self._synthesize_single_chunk(sentence)
-                        if chunk_audio is not None:
-                            audio_chunks.append(chunk_audio)
+                # Synthesize all sentences in one padded batch when possible
+                try:
+                    audio_chunks = self._synthesize_speecht5_batch(sentences) if sentences else []
+                except Exception as e:
+                    logger.warning(f"Batched SpeechT5 synthesis failed, falling back to single sentences: {e}")
+                    audio_chunks = [self._synthesize_single_chunk(sentence) for sentence in sentences]
+                audio_chunks = [chunk for chunk in audio_chunks if chunk is not None]
                 
                 if audio_chunks:
-                    # Add small pause between sentences
-                    pause_samples = np.zeros(int(0.3 * 16000))  # 0.3 second pause
-                    result = audio_chunks[0]
-                    for chunk in audio_chunks[1:]:
-                        result = np.concatenate([result, pause_samples, chunk])
-                    return result
+                    # Add small pause between sentences, writing every
+                    # sentence and pause into one preallocated buffer
+                    pause_samples = int(SENTENCE_PAUSE_SECONDS * self.get_sample_rate())
+                    total = sum(chunk.size for chunk in audio_chunks)
+                    total += pause_samples * (len(audio_chunks) - 1)
+                    
+                    result = np.empty(total, dtype=np.float32)
+                    position = 0
+                    for i, chunk in enumerate(audio_chunks):
+                        if i > 0:
+                            result[position:position + pause_samples] = 0
+                            position += pause_samples
+                        result[position:position + chunk.size] = chunk
+                        position += chunk.size
+                    return torch.from_numpy(result) if return_tensor else result
             
-            return self._synthesize_single_chunk(text)
+            return self._synthesize_single_chunk(text, return_tensor)
             
         except Exception as e:
             logger.error(f"SpeechT5 synthesis failed: {e}")
             return None
     
-    def _synthesize_single_chunk(self, text: str) -> Optional[np.ndarray]:
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        """Split a long SpeechT5 input into sentences, skipping very short segments."""
+        sentences = (s.strip() for s in _SENTENCE_SPLIT_RE.split(text))
+        return [s for s in sentences if len(s) > 5]
+    
+    def stream_speech(self, text: str) -> Iterator[np.ndarray]:
+        """
+        Synthesize text, yielding audio for each sentence as soon as it is ready.
+        
+        Long SpeechT5 inputs are split into the same sentences as in
+        synthesize_speech, so the first audio arrives after one sentence
+        instead of the whole text. Other inputs yield a single array.
+        
+        Args:
+            text: Input text to convert
+            
+        Yields:
+            Audio array for each sentence
+        """
+        if not self.model:
+            logger.error("No model loaded")
+            return
+        
+        sentences = []
+        if self._is_speecht5 and len(text) > SPEECHT5_SPLIT_CHARS:
+            sentences = self._split_sentences(text)
+        
+        if not sentences:
+            audio = self.synthesize_speech(text)
+            if audio is not None:
+                yield audio
+            return
+        
+        for sentence in sentences:
+            audio = self._synthesize_single_chunk(sentence)
+            if audio is not None:
+                yield audio
+    
+    def _synthesize_single_chunk(
+        self,
+        text: str,
+        return_tensor: bool = False
+    ) -> Optional[Union[np.ndarray, torch.Tensor]]:
         """Synthesize a single chunk of text."""
         try:
             # Tokenize input text
-            inputs = self.processor(text=text, return_tensors="pt")
-            input_ids = inputs["input_ids"].to(self.device)
-            
-            # Use speaker embeddings - ensure correct shape
-            speaker_emb = self.speaker_embeddings.to(self.device)
+            input_ids = self._cached_input_ids(text).to(self.device)
             
-            # Ensure speaker embedding has correct shape and select first speaker
-            if len(speaker_emb.shape) > 1:
-                speaker_emb = speaker_emb[0:1]  # Take first speaker embedding
-            else:
-                speaker_emb = speaker_emb.unsqueeze(0)
-            
-            # Generate speech
-            with torch.no_grad():
-                speech = self.model.generate_speech(input_ids, speaker_emb, vocoder=None)
+            # Generate speech with the embedding prepared at load time
+            with torch.inference_mode():
+                speech = self.model.generate_speech(
+                    input_ids, self.speaker_embeddings, vocoder=self.vocoder
+                )
+                
+                # Fade on the device; inference tensors can only be
+                # modified in place inside inference mode
+                if return_tensor:
+                    return self._smooth_edges_tensor(speech.float().flatten())
             
-            result = speech.cpu().numpy()
+            result = speech.float().cpu().numpy()
             
             # Ensure result is 1D and properly shaped
             if len(result.shape) > 1:
                 result = result.flatten()
             
-            # Add slight fade in/out for smoother audio
-            if len(result) > 1000:
-                fade_samples = min(500, len(result) // 10)
-                fade_in = np.linspace(0, 1, fade_samples)
-                fade_out = np.linspace(1, 0, fade_samples)
-                result[:fade_samples] *= fade_in
-                result[-fade_samples:] *= fade_out
-            
-            return result
+            return self._smooth_edges(result)
             
         except Exception as e:
             logger.warning(f"Single chunk synthesis failed: {e}")
             return None
     
-    def _synthesize_vits(self, text: str) -> Optional[np.ndarray]:
+    def _input_ids(self, text: str) -> torch.Tensor:
+        """Tokenize text with the current model's processor or tokenizer."""
+        if self.processor is not None:
+            return self.processor(text=text, return_tensors="pt")["input_ids"]
+        return self.tokenizer(text, return_tensors="pt")["input_ids"]
+    
+    def _synthesize_speecht5_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Synthesize several texts in one padded SpeechT5 generate_speech call."""
+        # Tokenize with padding to the longest text in the batch
+        inputs = self.processor(text=texts, padding=True, return_tensors="pt")
+        input_ids = inputs["input_ids"].to(self.device)
+        attention_mask = inputs["attention_mask"].to(self.device)
+        
+        # Every text uses the same voice
+        speaker_embeddings = self.speaker_embeddings.expand(len(texts), -1)
+        
+        with torch.inference_mode():
+            waveforms, lengths = self.model.generate_speech(
+                input_ids,
+                speaker_embeddings,
+                attention_mask=attention_mask,
+                vocoder=self.vocoder,
+                return_output_lengths=True
+            )
+        
+        # Trim each waveform to its own generated length
+        # With a vocoder, transformers returns the lengths as a plain list
+        waveforms = waveforms.float().cpu().numpy()
+        lengths = np.asarray(lengths)
+        
+        return [
+            self._smooth_edges(waveform[:int(length)])
+            for waveform, length in zip(waveforms, lengths)
+        ]
+    
+    @staticmethod
+    def _smooth_edges_tensor(result: torch.Tensor) -> torch.Tensor:
+        """Add the same slight fade in/out as _smooth_edges to a 1D tensor, in place."""
+        if result.numel() > 1000:
+            fade_samples = min(500, result.numel() // 10)
+            fade_in = torch.linspace(0, 1, fade_samples, device=result.device, dtype=result.dtype)
+            result[:fade_samples].mul_(fade_in)
+            result[-fade_samples:].mul_(fade_in.flip(0))
+        
+        return result
+    
+    @staticmethod
+    def _smooth_edges(result: np.ndarray) -> np.ndarray:
+        """Add a slight fade in/out to synthesized audio, in place."""
+        if len(result) > 1000:
+            fade_samples = min(500, len(result) // 10)
+            fade_in, fade_out = _edge_fade(fade_samples)
+            head = result[:fade_samples]
+            tail = result[-fade_samples:]
+            np.multiply(head, fade_in, out=head)
+            np.multiply(tail, fade_out, out=tail)
+        
+        return result
+    
+    def _synthesize_vits(
+        self,
+        text: str,
+        return_tensor: bool = False
+    ) -> Union[np.ndarray, torch.Tensor]:
         """Synthesize speech using VITS model."""
         # Tokenize input text
-        inputs = self.tokenizer(text, return_tensors="pt")
-        input_ids = inputs["input_ids"].to(self.device)
+        input_ids = self._cached_input_ids(text).to(self.device)
         
         # Generate speech
-        with torch.no_grad():
+        with torch.inference_mode():
             output = self.model(input_ids)
-            audio = output.waveform
+            audio = output.waveform.float().squeeze()
         
-        return audio.cpu().numpy().squeeze()
+        return audio if return_tensor else audio.cpu().numpy()
+    
+    def _synthesize_vits_batch(self, texts: List[str], inputs=None) -> List[np.ndarray]:
+        """Synthesize several texts in one padded VITS forward pass, optionally pre-tokenized."""
+        # Tokenize with padding to the longest text in the batch
+        if inputs is None:
+            inputs = self.tokenizer(texts, return_tensors="pt", padding=True)
+        input_ids = inputs["input_ids"].to(self.device)
+        attention_mask = inputs["attention_mask"].to(self.device)
+        
+        # Generate speech
+        with torch.inference_mode():
+            output = self.model(input_ids, attention_mask=attention_mask)
+        
+        # Trim each waveform to its own predicted length
+        waveforms = output.waveform.float().cpu().numpy()
+        lengths = output.sequence_lengths.cpu().numpy()
+        
+        return [waveform[:int(length)] for waveform, length in zip(waveforms, lengths)]
+    
+    @property
+    def _is_speecht5(self) -> bool:
+        """Whether the loaded model is SpeechT5."""
+        return isinstance(self.model, SpeechT5ForTextToSpeech)
+    
+    @property
+    def supports_batching(self) -> bool:
+        """Whether the current model synthesizes several texts per forward pass."""
+        return "mms-tts" in self.model_name or "vits" in self.model_name.lower()
+    
+    def set_num_threads(self, num_threads: int):
+        """
+        Set the number of CPU threads used for inference.
+        
+        Args:
+            num_threads: Intra-op thread count for PyTorch
+        """
+        torch.set_num_threads(max(1, num_threads))
+        
+        # Input shapes vary per chunk, so autotuning would rerun constantly
+        torch.backends.cudnn.benchmark = False
+        logger.info(f"Using {torch.get_num_threads()} inference thread(s)")
+    
+    def warmup(self, text: str = "Hello world."):
+        """
+        Run one throwaway synthesis so the first real request is not cold.
+        
+        The first forward pass pays for lazy kernel initialization, cuDNN
+        setup and paging in the weights.
+        
+        Args:
+            text: Short text to synthesize
+        """
+        with torch.inference_mode():
+            audio = self.synthesize_speech(text)
+        
+        if self.device.startswith("cuda"):
+            torch.cuda.synchronize()
+        
+        if audio is None:
+            logger.warning("Warmup synthesis produced no audio")
+        else:
+            logger.info("Model warmed up")
     
     def get_sample_rate(self) -> int:
         """Get the sample rate for the current model."""
@@ -266,6 +700,8 @@ class TTSModelManager:
         info = {
             "model_name": self.model_name,
             "device": self.device,
+            "dtype": str(self.dtype),
+            "quantization": self.quantization,
             "model_type": config.get("type", "unknown"),
             "sample_rate": config.get("sample_rate", 16000),
             "requires_speaker_embedding": config.get("requires_speaker_embedding", False),
@@ -297,6 +733,8 @@ class TTSModelManager:
             self.model = None
             self.processor = None
             self.tokenizer = None
+            self.vocoder = None
+            self._cached_input_ids.cache_clear()
             
             # Load new model
             self.model_name = model_name
@@ -307,24 +745,81 @@ class TTSModelManager:
             logger.error(f"Failed to switch to model {model_name}: {e}")
             return False
     
-    def batch_synthesize(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+    def batch_synthesize(
+        self,
+        texts: List[str],
+        batch_size: int = 8,
+        return_tensor: bool = False,
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> List[Optional[Union[np.ndarray, torch.Tensor]]]:
         """
         Synthesize speech for multiple texts.
         
+        VITS models synthesize each group of batch_size texts in a single
+        padded forward pass; other models process texts one at a time.
+        Either way, the next batch or text is tokenized in the background
+        while the model runs.
+        
         Args:
             texts: List of input texts
+            batch_size: Number of texts per forward pass for batched models
+            return_tensor: Return torch tensors instead of numpy arrays (see
+                synthesize_speech); batched VITS audio is a CPU tensor
+            progress_callback: Called with (texts done, total texts) after
+                each batch or text
             
         Returns:
-            List of audio arrays
+            List of audio arrays (or tensors)
         """
-        results = []
-        
-        for i, text in enumerate(texts):
-            logger.info(f"Processing text {i+1}/{len(texts)}")
-            audio = self.synthesize_speech(text)
-            results.append(audio)
-        
-        return results
+        # A background thread tokenizes the next batch (or text) while the
+        # model runs on the current one
+        with ThreadPoolExecutor(max_workers=1) as tokenizer_pool:
+            if self.supports_batching:
+                results = []
+                batches = [texts[start:start + batch_size] for start in range(0, len(texts), batch_size)]
+                
+                def tokenize(batch):
+                    return self.tokenizer(batch, return_tensors="pt", padding=True)
+                
+                pending = tokenizer_pool.submit(tokenize, batches[0]) if batches else None
+                
+                for i, batch in enumerate(batches):
+                    start = i * batch_size
+                    logger.info(f"Processing texts {start+1}-{start+len(batch)}/{len(texts)}")
+                    
+                    current = pending
+                    if i + 1 < len(batches):
+                        pending = tokenizer_pool.submit(tokenize, batches[i + 1])
+                    
+                    try:
+                        waveforms = self._synthesize_vits_batch(batch, current.result())
+                        if return_tensor:
+                            waveforms = [torch.from_numpy(waveform) for waveform in waveforms]
+                        results.extend(waveforms)
+                    except Exception as e:
+                        logger.warning(f"Batched synthesis failed, falling back to single texts: {e}")
+                        results.extend(self.synthesize_speech(text, return_tensor=return_tensor) for text in batch)
+                    
+                    if progress_callback:
+                        progress_callback(len(results), len(texts))
+                
+                return results
+            
+            results = []
+            
+            for i, text in enumerate(texts):
+                # Texts short enough for a single chunk hit the token cache
+                if i + 1 < len(texts) and len(texts[i + 1]) <= SPEECHT5_SPLIT_CHARS:
+                    tokenizer_pool.submit(self._cached_input_ids, texts[i + 1])
+                
+                logger.info(f"Processing text {i+1}/{len(texts)}")
+                audio = self.synthesize_speech(text, return_tensor=return_tensor)
+                results.append(audio)
+                
+                if progress_callback:
+                    progress_callback(len(results), len(texts))
+            
+            return results
     
     def estimate_duration(self, text: str) -> float:
         """
@@ -343,13 +838,20 @@ class TTSModelManager:
         return estimated_duration
     
     def cleanup(self):
-        """Clean up model resources."""
+        """
+        Release this manager's model resources.
+        
+        Pretrained weights shared with other managers stay loaded until
+        clear_pretrained_cache() is called.
+        """
         if self.model:
             del self.model
         if self.processor:
             del self.processor
         if self.tokenizer:
             del self.tokenizer
+        if self.vocoder:
+            del self.vocoder
         
         # Clear GPU cache if using CUDA
         if torch.cuda.is_available():